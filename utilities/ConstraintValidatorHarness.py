@@ -1,7 +1,18 @@
 import json
-from typing import Dict, Any, Optional, Union, List
+import mmap
+import os
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Mapping, Optional, Tuple, Union, List
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    # Fallback to stdlib json; orjson is only required for zero-copy buffer parsing.
+    orjson = None
+
 # Assuming standardized constants for triggers and severities improve intelligence
 class TriggerCode(str, Enum):
     TEMPORAL_VIOLATION = "P-M01"
@@ -15,27 +26,70 @@ class Severity(str, Enum):
 
 # --- System Mock Logger (Awaiting integration with core.Logger) ---
 class SystemLogger:
-    def info(self, msg: str): print(f"[INFO][ConstraintHarness] {msg}")
-    def error(self, msg: str): print(f"[ERROR][ConstraintHarness] {msg}")
-    def warn(self, msg: str): print(f"[WARNING][ConstraintHarness] {msg}")
+    # Messages accept %-style args, matching the logging API the integration will target.
+    def info(self, msg: str, *args: Any): print(f"[INFO][ConstraintHarness] {msg % args if args else msg}")
+    def error(self, msg: str, *args: Any): print(f"[ERROR][ConstraintHarness] {msg % args if args else msg}")
+    def warn(self, msg: str, *args: Any): print(f"[WARNING][ConstraintHarness] {msg % args if args else msg}")
 
 LOG = SystemLogger()
 
 TemporalLimits = Dict[str, int]
 GAXSpec = Dict[str, str]
+GAXEntry = Tuple[Optional[str], str, Dict[str, Union[str, bool, None]]]
+TemporalValidator = Callable[[int], Dict[str, Optional[str]]]
+
+# Enum values resolved once; used on the evaluation paths instead of per-call `.value` lookups.
+_TRIG_TEMPORAL = TriggerCode.TEMPORAL_VIOLATION.value
+_TRIG_INTEGRITY = TriggerCode.INTEGRITY_HALT.value
+_SEV_HARD = Severity.HARD_HALT.value
+_SEV_SOFT = Severity.SOFT_WARNING.value
+
+# Static portions of the common-case results, prebuilt once. Callers always receive a fresh plain dict
+# (a shallow copy of these templates), the same type as the violation results.
+_COMPLIANT_RESULT = {"trigger": None, "severity": Severity.COMPLIANT.value, "action": "Compliant"}
+_UNCONSTRAINED_RESULT = {"trigger": None, "severity": Severity.UNCONSTRAINED.value, "action": "Compliant by Default"}
+
+# Files below this size are read in one shot; mmap setup does not amortize on small bundles.
+MMAP_THRESHOLD_BYTES = 1 << 20
+
+def _parse_json_buffer(buffer) -> Any:
+    """Parses a bytes-like buffer, handing it to orjson without an intermediate copy when available."""
+    if orjson is not None:
+        return orjson.loads(buffer)
+    return json.loads(bytes(buffer))
+
+@lru_cache(maxsize=8)
+def _read_constraints(path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    """Parses the constraint file once per (path, mtime, size) version; the stat fields only key the
+    cache, so an edited file is re-read. Errors propagate and are not cached.
+
+    Large constraint bundles are memory-mapped and parsed directly from the mapped pages.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    data = _parse_json_buffer(view)
+        else:
+            data = _parse_json_buffer(f.read())
+    # Shared across every harness built from the same path, so expose it read-only.
+    return MappingProxyType(data)
 
-def load_constraints(path: str = 'config/pim_constraints.json') -> Dict[str, Any]:
-    """Loads PIM constraint specifications using proper error handling and logging."""
+def load_constraints(path: str = 'config/pim_constraints.json') -> Mapping[str, Any]:
+    """Loads PIM constraint specifications using proper error handling and logging.
+
+    Results are cached until the file's mtime or size changes and returned as a read-only mapping.
+    """
     try:
-        with open(path, 'r') as f:
-            data = json.load(f)
-            LOG.info(f"Successfully loaded constraints from {path}.")
-            return data
+        st = os.stat(path)
+        data = _read_constraints(path, st.st_mtime_ns, st.st_size)
+        LOG.info("Successfully loaded constraints from %s.", path)
+        return data
     except FileNotFoundError:
-        LOG.error(f"FATAL: Constraint file not found at {path}. Harness operating in passive mode.")
+        LOG.error("FATAL: Constraint file not found at %s. Harness operating in passive mode.", path)
         return {}
     except json.JSONDecodeError:
-        LOG.error(f"FATAL: Invalid JSON structure in {path}. Check file integrity.")
+        LOG.error("FATAL: Invalid JSON structure in %s. Check file integrity.", path)
         return {}
 
 class ConstraintValidatorHarness:
@@ -51,88 +105,115 @@ class ConstraintValidatorHarness:
         else:
             self.constraints = load_constraints(constraint_path)
 
-        # Structure decomposition for faster lookup
+        # Structure decomposition for faster lookup. Keys are interned so lookups with interned
+        # axiom_id/stage_name strings (e.g. module-level constants) resolve by identity.
         self.p_set_rules: List[Any] = self.constraints.get('P_SET_Rules', [])
-        self.gax_limits: Dict[str, GAXSpec] = self.constraints.get('GAX_Limits', {})
-        self.temporal_limits: Dict[str, TemporalLimits] = self.constraints.get('Temporal_Limits', {})
+        self.gax_limits: Dict[str, GAXSpec] = {
+            sys.intern(k): v for k, v in self.constraints.get('GAX_Limits', {}).items()
+        }
+        self.temporal_limits: Dict[str, TemporalLimits] = {
+            sys.intern(k): v for k, v in self.constraints.get('Temporal_Limits', {}).items()
+        }
+        # Flattened GAX table: axiom_id -> (expected_hash, trigger_code, success result template).
+        # Empty specs are left out so they resolve as unconstrained, as before.
+        self._gax: Dict[str, GAXEntry] = {
+            axiom_id: (
+                spec.get('expected_hash'),
+                spec.get('trigger', _TRIG_INTEGRITY),
+                {"success": True, "trigger": None, "message": f"Artifact '{axiom_id}' integrity validation successful."},
+            )
+            for axiom_id, spec in self.gax_limits.items() if spec
+        }
         
+        self._index_temporal_limits()
+
         if not self.constraints:
             LOG.warn("Harness initialized in passive (unconstrained) mode. All validation checks will default to success/no-violation.")
         else:
-            LOG.info(f"Harness Active. Loaded {len(self.p_set_rules)} P-Set rules and {len(self.temporal_limits)} temporal definitions.")
-
-    def _get_temporal_limits(self, stage_name: str) -> Optional[TemporalLimits]:
-        """Retrieves soft and hard limits for a specific stage from constraints, enforcing structural integrity."""
-        limits = self.temporal_limits.get(stage_name)
-        
-        required_keys = ['soft_limit_ms', 'hard_limit_ms']
-        
-        if limits and all(k in limits for k in required_keys):
+            LOG.info("Harness Active. Loaded %d P-Set rules and %d temporal definitions.", len(self.p_set_rules), len(self.temporal_limits))
+
+    def _index_temporal_limits(self) -> None:
+        """Splits temporal limits into flat per-stage soft/hard tables and specialized per-stage validators,
+        rejecting malformed entries up front."""
+        self._soft: Dict[str, int] = {}
+        self._hard: Dict[str, int] = {}
+        self._validators: Dict[str, TemporalValidator] = {}
+        required_keys = ('soft_limit_ms', 'hard_limit_ms')
+
+        for stage_name, limits in self.temporal_limits.items():
+            if not limits or not all(k in limits for k in required_keys):
+                LOG.warn("Temporal constraints missing or malformed for stage: %s. Skipping validation.", stage_name)
+                continue
             # Ensure they are integers, failing noisily if not (high intelligence requirement)
             if not all(isinstance(limits[k], int) for k in required_keys):
-                LOG.error(f"Malformed temporal data: Limits for {stage_name} must be integers.")
-                return None
-            return limits
-            
-        LOG.warn(f"Temporal constraints missing or malformed for stage: {stage_name}. Skipping validation.")
-        return None
+                LOG.error("Malformed temporal data: Limits for %s must be integers.", stage_name)
+                continue
+            self._soft[stage_name] = limits['soft_limit_ms']
+            self._hard[stage_name] = limits['hard_limit_ms']
+            self._validators[stage_name] = self._make_temporal_validator(
+                stage_name, limits['soft_limit_ms'], limits['hard_limit_ms']
+            )
+
+    @staticmethod
+    def _make_temporal_validator(stage_name: str, soft_limit_ms: int, hard_limit_ms: int) -> TemporalValidator:
+        """Builds a validator for one stage with its limits and compliant result template bound as closure locals."""
+        compliant = {"stage": stage_name, **_COMPLIANT_RESULT}
+        # Violation messages depend only on the stage, so they are formatted once here.
+        hard_msg = f"[{_TRIG_TEMPORAL}][{_SEV_HARD}] {stage_name} exceeded hard limit ({hard_limit_ms}ms)."
+        soft_msg = f"[{_TRIG_TEMPORAL}][{_SEV_SOFT}] {stage_name} exceeded soft limit ({soft_limit_ms}ms)."
+
+        def validate(duration_ms: int) -> Dict[str, Union[str, None]]:
+            if duration_ms > hard_limit_ms:
+                LOG.warn(hard_msg)
+                return {
+                    "stage": stage_name, 
+                    "trigger": _TRIG_TEMPORAL, 
+                    "severity": _SEV_HARD, 
+                    "action": "Integrity Halt (IH)"
+                }
+            if duration_ms > soft_limit_ms:
+                LOG.info(soft_msg)
+                return {
+                    "stage": stage_name, 
+                    "trigger": _TRIG_TEMPORAL, 
+                    "severity": _SEV_SOFT, 
+                    "action": "Log & Proceed"
+                }
+            # A copy, so every outcome is a fresh plain dict like the violation results.
+            return dict(compliant)
+
+        return validate
     
     def run_gax_check(self, axiom_id: str, verifiable_artifact_hash: str) -> Dict[str, Union[str, bool, None]]:
         """
         P-M02 / GAX Check: Validates the integrity hash of a verifiable artifact 
         against the expected hash defined in the constraint structure.
         """
-        check_spec = self.gax_limits.get(axiom_id)
+        entry = self._gax.get(axiom_id)
         
-        if not check_spec:
+        if entry is None:
             return {"success": True, "trigger": None, "message": f"GAX check '{axiom_id}' is unconstrained. Proceeding."}
         
-        expected_hash = check_spec.get('expected_hash')
-        trigger_code = check_spec.get('trigger', TriggerCode.INTEGRITY_HALT.value)
+        expected_hash, trigger_code, success_result = entry
 
         if verifiable_artifact_hash != expected_hash:
-            LOG.error(f"INTEGRITY VIOLATION [{trigger_code}]: Artifact '{axiom_id}' hash mismatch detected.")
+            LOG.error("INTEGRITY VIOLATION [%s]: Artifact '%s' hash mismatch detected.", trigger_code, axiom_id)
             return {
                 "success": False, 
                 "trigger": trigger_code, 
                 "message": f"Integrity Halt requested. Expected hash: '{expected_hash}'."
             }
         
-        return {"success": True, "trigger": None, "message": f"Artifact '{axiom_id}' integrity validation successful."}
+        return dict(success_result)
 
     def evaluate_temporal_violation(self, stage_name: str, duration_ms: int) -> Dict[str, Union[str, None]]:
         """Evaluates P-M01 linearity violation based on dynamic limits retrieved by stage_name."""
-        limits = self._get_temporal_limits(stage_name)
-
-        if not limits:
-            return {"stage": stage_name, "trigger": None, "severity": Severity.UNCONSTRAINED.value, "action": "Compliant by Default"}
+        validator = self._validators.get(stage_name)
 
-        soft_limit_ms = limits['soft_limit_ms']
-        hard_limit_ms = limits['hard_limit_ms']
+        if validator is None:
+            return {"stage": stage_name, **_UNCONSTRAINED_RESULT}
 
-        if duration_ms > hard_limit_ms:
-            LOG.warn(f"[{TriggerCode.TEMPORAL_VIOLATION.value}][{Severity.HARD_HALT.value}] {stage_name} exceeded hard limit ({hard_limit_ms}ms).")
-            return {
-                "stage": stage_name, 
-                "trigger": TriggerCode.TEMPORAL_VIOLATION.value, 
-                "severity": Severity.HARD_HALT.value, 
-                "action": "Integrity Halt (IH)"
-            }
-        elif duration_ms > soft_limit_ms:
-            LOG.info(f"[{TriggerCode.TEMPORAL_VIOLATION.value}][{Severity.SOFT_WARNING.value}] {stage_name} exceeded soft limit ({soft_limit_ms}ms).")
-            return {
-                "stage": stage_name, 
-                "trigger": TriggerCode.TEMPORAL_VIOLATION.value, 
-                "severity": Severity.SOFT_WARNING.value, 
-                "action": "Log & Proceed"
-            }
-        
-        return {
-            "stage": stage_name, 
-            "trigger": None, 
-            "severity": Severity.COMPLIANT.value, 
-            "action": "Compliant"
-        }
+        return validator(duration_ms)
 
 if __name__ == "__main__":
     
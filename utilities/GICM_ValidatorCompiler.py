@@ -1,3 +1,33 @@
+import copy
+import json
+import os
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
+
+
+@lru_cache(maxsize=8)
+def _parse_schema(schema_path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    """Parses a GICM schema once per (path, mtime, size) version; the stat fields only key the cache."""
+    with open(schema_path, 'r') as f:
+        return MappingProxyType(json.load(f))
+
+
+def _load_schema(schema_path: str) -> Mapping[str, Any]:
+    """Returns the parsed schema, re-read whenever the file changes. The shared result is read-only."""
+    st = os.stat(schema_path)
+    return _parse_schema(schema_path, st.st_mtime_ns, st.st_size)
+
+
+def _parse_version(version: str) -> Tuple[int, ...]:
+    """Parses a dotted numeric version (e.g. '2.0.0') into an int tuple for ordered comparison."""
+    try:
+        return tuple(int(part) for part in version.split('.'))
+    except ValueError:
+        raise ValueError(f"Malformed GICM Schema version: '{version}'.") from None
+
+
 class GICMValidatorCompiler:
     """
     Reads the machine-readable GICM Schema (V2.0.0+) and generates
@@ -9,23 +39,36 @@ class GICMValidatorCompiler:
     """
 
     def __init__(self, schema_path: str):
-        import json
-        with open(schema_path, 'r') as f:
-            self.schema = json.load(f)
+        self.schema = _load_schema(schema_path)
+        # Compiled plans per entity; the schema is static after load, so each entity compiles once.
+        self._plans: Dict[str, Mapping[str, Any]] = {}
         
-        if self.schema.get('version') < '2.0.0':
-             raise ValueError("Requires GICM Schema V2.0.0 or higher for structured constraints.")
+        # Parsed once; tuple comparison orders '10.0.0' after '2.0.0', unlike string comparison.
+        self.schema_version: Tuple[int, ...] = _parse_version(str(self.schema.get('version', '0')))
+        if self.schema_version < (2, 0, 0):
+            raise ValueError("Requires GICM Schema V2.0.0 or higher for structured constraints.")
 
-    def compile_entity_validation_rules(self, entity_name: str) -> dict:
-        """Translates structured constraints into executable rules for a given entity."""
-        
-        entity = self.schema['entities'].get(entity_name)
-        compiled_rules = {
-            "integrity_check": entity['integrity_model'],
-            "field_validators": []
+    def compile_entity_validation_rules(self, entity_name: str) -> Dict[str, Any]:
+        """Translates structured constraints into executable rules for a given entity.
+
+        Plans are compiled once per entity; each call returns a fresh dict/list copy of the memoized
+        plan, so callers may mutate or serialize it freely.
+        """
+        plan = self._plans.get(entity_name)
+        if plan is None:
+            plan = self._plans[entity_name] = self._compile_entity(entity_name)
+        return {
+            "integrity_check": copy.deepcopy(plan["integrity_check"]),
+            "field_validators": [copy.deepcopy(dict(rule)) for rule in plan["field_validators"]],
         }
 
+    def _compile_entity(self, entity_name: str) -> Mapping[str, Any]:
+        """Walks the entity's field definitions once to build its frozen validation plan."""
+        entity = self.schema['entities'].get(entity_name)
+        field_validators = []
+
         for field_name, field_def in entity['fields'].items():
+            field_name = sys.intern(field_name)
             rule = {"field": field_name, "type": field_def['type']}
             
             # Process machine-readable constraints
@@ -38,6 +81,9 @@ class GICMValidatorCompiler:
             if 'governance' in field_def:
                 rule['monitoring_config'] = field_def['governance']
 
-            compiled_rules['field_validators'].append(rule)
+            field_validators.append(MappingProxyType(rule))
             
-        return compiled_rules
\ No newline at end of file
+        return MappingProxyType({
+            "integrity_check": entity['integrity_model'],
+            "field_validators": tuple(field_validators)
+        })
@@ -1,10 +1,37 @@
 import hashlib
 import logging
 import hmac
-from typing import Union, Optional
+from functools import lru_cache, partial
+from typing import Any, Callable, List, Sequence, Tuple, Union, Optional
 
 logger = logging.getLogger(__name__)
 
+Content = Union[str, bytes, bytearray, memoryview]
+
+
+@lru_cache(maxsize=1024)
+def _hex_to_bytes(hex_digest: str) -> bytes:
+    """Decodes an expected hex digest; cached since batches often repeat the same expected hash."""
+    return bytes.fromhex(hex_digest)
+
+
+def _as_bytes(content: Content) -> Union[bytes, bytearray, memoryview]:
+    """Returns bytes-like content as-is and encodes str content as UTF-8."""
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return content
+    return content.encode('utf-8')
+
+
+def _expected_or_none(expected_hash_hex: str) -> Optional[bytes]:
+    """Decodes an expected hex digest, returning None when it is missing or not valid hex."""
+    if not expected_hash_hex:
+        return None
+    try:
+        return _hex_to_bytes(expected_hash_hex)
+    except ValueError:
+        return None
+
+
 class IntegrityHashValidator:
     """
     Validates the integrity hash of input content (GSEP L0 payloads or local files).
@@ -20,28 +47,30 @@ class IntegrityHashValidator:
         :param algorithm: The hashlib-supported algorithm name (e.g., 'sha256', 'sha512').
         """
         self.algorithm = algorithm.lower()
-        
-        # Pre-check if the algorithm is supported
-        if self.algorithm not in hashlib.algorithms_available:
+        self._hasher_ctor: Optional[Callable[[bytes], Any]] = None
+
+        # Resolve the constructor once so the hot path skips hashlib.new's name dispatch.
+        if self.algorithm in hashlib.algorithms_available:
+            self._hasher_ctor = getattr(hashlib, self.algorithm, None) or partial(hashlib.new, self.algorithm)
+        else:
             logger.critical(
-                f"Configured hash algorithm '{algorithm}' is not available in system hashlib. "
-                "Validation attempts will likely fail."
+                "Configured hash algorithm '%s' is not available in system hashlib. "
+                "Validation attempts will fail.",
+                algorithm,
             )
-        
+
     def _calculate_hash(self, content_data: bytes) -> Optional[bytes]:
         """Calculates the hash digest based on the configured algorithm, returning bytes."""
-        try:
-            h = hashlib.new(self.algorithm, content_data)
-            return h.digest() 
-        except ValueError as e:
-            logger.critical(f"Hash calculation failed due to unsupported algorithm '{self.algorithm}': {e}")
+        if self._hasher_ctor is None:
             return None
+        return self._hasher_ctor(content_data).digest()
 
-    def validate_hash(self, content: Union[str, bytes], expected_hash_hex: str) -> bool:
+    def validate_hash(self, content: Content, expected_hash_hex: str) -> bool:
         """
         Compares the generated hash of the content against the expected hash.
 
-        :param content: The raw data (str or bytes) to be validated. If str, encoded as UTF-8.
+        :param content: The raw data to be validated. Bytes-like input (bytes, bytearray, memoryview)
+                        is hashed in place without copying; str is encoded as UTF-8.
         :param expected_hash_hex: The expected hash digest represented as a hexadecimal string.
         :return: True if the hashes match securely, False otherwise.
         """
@@ -49,33 +78,60 @@ class IntegrityHashValidator:
             logger.warning("Attempted integrity validation with missing content or expected hash.")
             return False
 
-        if isinstance(content, str):
-            content_bytes = content.encode('utf-8')
-        else:
-            content_bytes = content
-            
-        calculated_digest_bytes = self._calculate_hash(content_bytes)
+        calculated_digest_bytes = self._calculate_hash(_as_bytes(content))
 
         if calculated_digest_bytes is None:
             return False
 
         try:
             # Convert expected hex string to bytes for cryptographic comparison
-            expected_digest_bytes = bytes.fromhex(expected_hash_hex)
+            expected_digest_bytes = _hex_to_bytes(expected_hash_hex)
         except ValueError:
-            logger.error(f"Expected hash '{expected_hash_hex}' is not a valid hex string.")
+            logger.error("Expected hash '%s' is not a valid hex string.", expected_hash_hex)
             return False
 
         # Use hmac.compare_digest for constant-time comparison (timing attack mitigation)
         if hmac.compare_digest(calculated_digest_bytes, expected_digest_bytes):
-            logger.debug(f"Payload integrity verified using {self.algorithm}.")
+            logger.debug("Payload integrity verified using %s.", self.algorithm)
             return True
         else:
             logger.error(
-                f"[HASH MISMATCH:{self.algorithm}] "
-                f"Expected: {expected_hash_hex[:12]}..., Calculated: {calculated_digest_bytes.hex()[:12]}..."
-            )
-            logger.debug(
-                f"Full comparison failure. Calc: {calculated_digest_bytes.hex()}, Exp: {expected_hash_hex}"
+                "[HASH MISMATCH:%s] Expected: %s..., Calculated: %s...",
+                self.algorithm, expected_hash_hex[:12], calculated_digest_bytes[:6].hex(),
             )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Full comparison failure. Calc: %s, Exp: %s",
+                    calculated_digest_bytes.hex(), expected_hash_hex,
+                )
             return False
+
+    def validate_hash_batch(self, items: Sequence[Tuple[Content, str]]) -> List[bool]:
+        """
+        Validates many (content, expected_hash_hex) pairs in a single call.
+
+        Equivalent to calling validate_hash per item, but resolves the hasher and comparison
+        once and decodes all expected digests up front. Per-item mismatches are summarized
+        in a single log record rather than logged individually.
+
+        :param items: Sequence of (content, expected_hash_hex) pairs.
+        :return: One boolean per item, in input order.
+        """
+        ctor = self._hasher_ctor
+        if ctor is None:
+            return [False] * len(items)
+
+        compare = hmac.compare_digest
+        expected = [_expected_or_none(h) for _, h in items]
+        results = [
+            bool(c) and e is not None and compare(ctor(_as_bytes(c)).digest(), e)
+            for (c, _), e in zip(items, expected)
+        ]
+
+        failures = results.count(False)
+        if failures:
+            logger.error(
+                "[HASH MISMATCH:%s] %d of %d batch payloads failed integrity validation.",
+                self.algorithm, failures, len(results),
+            )
+        return results
@@ -1,31 +1,99 @@
+import os
+import selectors
 import threading
 import time
 import json
+from array import array
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .SensorAPI import METRIC_LAYOUT, SensorAPI
 
 # NOTE: Assuming the availability of system.monitoring.SensorAPI for resource fetching.
 # This component enforces the lowest possible read latency by using cached data.
 
+# Default slot layout of the telemetry ring: one float column per SensorAPI.METRIC_LAYOUT entry.
+# A sensor that overrides read_all() sizes the ring from its own metric_layout instead.
+# Capture timestamps live in a parallel int64 array (see STAMP_FIELDS).
+RING_FIELDS: Tuple[Tuple[str, str], ...] = METRIC_LAYOUT
+# Per-slot integer timestamps: monotonic capture time and wall-clock time, both in nanoseconds.
+STAMP_FIELDS: Tuple[str, ...] = ('monotonic_ns', 'wall_ns')
+DEFAULT_RING_SIZE = 64
+
+# os.eventfd is Linux-only (Python 3.10+); other platforms wake the monitor through a self-pipe.
+_HAS_EVENTFD = hasattr(os, 'eventfd')
+
+
+def _open_wakeup_channel() -> Tuple[int, int]:
+    """Returns (read_fd, write_fd) for the shutdown wake channel.
+
+    With eventfd both ends are descriptors for the same counter; the write end is a dup so the
+    monitor thread and shutdown() can each close their own descriptor independently.
+    """
+    if _HAS_EVENTFD:
+        fd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+        return fd, os.dup(fd)
+    return os.pipe()
+
 class RTOM:
     """Real-Time Operational Monitor (RTOM) v94.1
 
     Provides low-latency, unbuffered telemetry by utilizing a dedicated background thread
     to constantly update resource consumption metrics and stage transition timestamps.
     This ensures get_real_time_telemetry() is a fast, non-blocking operation.
+
+    Samples are written into a preallocated ring of fixed-layout float slots (the sensor's
+    metric_layout, RING_FIELDS by default); the monitor thread overwrites slot `head % N` in
+    place and then publishes `head`, so a tick allocates no telemetry dicts. Readers materialize
+    a dict from the latest slot on demand. Sensors that do not override SensorAPI.read_all have
+    no declared layout, so their get_all_resource_metrics() dict is stored per slot unchanged.
     """
 
-    # Shared low-latency internal cache updated by the monitoring thread
-    _metrics_cache: Dict[str, Any] = {}
+    # All telemetry state is per instance; __slots__ drops the per-instance __dict__ and keeps
+    # the monitor thread's attribute loads off the class dict.
+    __slots__ = (
+        'config', 'polling_rate', 'affinity_cpu', 'realtime_priority', '_ring', '_ring_fields', '_snapshots', '_stamps',
+        '_head', '_temporal_markers', '_sensor_hooks', '_read_sensors', '_shutdown_flag', '_wakeup_r', '_wakeup_w',
+        '_monitoring_thread',
+    )
 
     def __init__(self, metrics_config_path: str = 'config/rtom_metrics_config.json', sensor_api=None):
         self.config = self._load_config(Path(metrics_config_path))
         self.polling_rate = self.config.get('polling_rate_s', 0.1) # Default 100ms
-        
+        # Optional low-jitter placement of the monitor thread (Linux): pin it to one CPU and/or run it
+        # under SCHED_FIFO at the given priority. Both default to off.
+        self.affinity_cpu = self.config.get('affinity_cpu')
+        self.realtime_priority = self.config.get('realtime_priority')
+
         # Initialize Sensor hooks (uses provided API or falls back to system context)
         self._sensor_hooks = self._initialize_sensors(sensor_api)
+        read_all = getattr(type(self._sensor_hooks), 'read_all', None)
+        if read_all is None or read_all is SensorAPI.read_all:
+            # No batch reader: publish the sensor's own dict per slot, keeping every group, key and type.
+            self._read_sensors = None
+            self._ring_fields: Tuple[Tuple[str, str], ...] = ()
+        else:
+            self._read_sensors = self._sensor_hooks.read_all
+            self._ring_fields = tuple(getattr(self._sensor_hooks, 'metric_layout', RING_FIELDS))
+
+        # Preallocated telemetry ring; _head counts completed writes (single int store, atomic under the GIL).
+        ring_size = max(2, int(self.config.get('ring_size', DEFAULT_RING_SIZE)))
+        self._ring: List[array] = [array('d', bytes(8 * len(self._ring_fields))) for _ in range(ring_size)]
+        self._snapshots: List[Optional[Dict[str, Any]]] = [None] * ring_size
+        # Slot i's stamps sit at [i * len(STAMP_FIELDS):]; ns ints are stored unboxed and only
+        # converted to float seconds when a reader asks for telemetry.
+        self._stamps = array('q', bytes(8 * len(STAMP_FIELDS) * ring_size))
+        self._head = 0
+        self._temporal_markers: list = []
         
         self._shutdown_flag = threading.Event()
+        # eventfd (or self-pipe) used by shutdown() to wake the monitor out of select() immediately.
+        self._wakeup_r, self._wakeup_w = _open_wakeup_channel()
         
         # Start the background monitoring loop
         self._monitoring_thread = threading.Thread(
@@ -42,9 +110,11 @@ class RTOM:
                 print(f"RTOM Config not found at {path}. Using default configuration.")
                 return {'polling_rate_s': 0.1, 'sensors': ['cpu', 'memory']}
             
+            if orjson is not None:
+                return orjson.loads(path.read_bytes())
             with open(path, 'r') as f:
                 return json.load(f)
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
             raise RuntimeError(f"Failed to parse RTOM configuration: {e}")
 
     def _initialize_sensors(self, sensor_api):
@@ -56,44 +126,138 @@ class RTOM:
         return sensor_api
 
     def _run_monitoring_loop(self):
-        """Dedicated thread function for continuous, high-frequency data capture."""
-        while not self._shutdown_flag.is_set():
-            try:
-                telemetry = {
-                    'timestamp_utc': time.time(), 
-                    'resource_metrics': self._get_resource_status(),
-                    'temporal_markers': self._get_temporal_events()
-                }
+        """Dedicated thread function for continuous, event-driven data capture.
+
+        Blocks on the sensor's event fds (SensorAPI.get_event_fds) and the shutdown wake fd,
+        capturing a sample whenever a sensor signals or polling_rate elapses, whichever is first.
+        polling_rate therefore bounds staleness rather than imposing a fixed cadence.
+        """
+        self._apply_thread_scheduling()
+
+        stamps = self._stamps
+        ring_size = len(self._ring)
+        get_event_fds = getattr(self._sensor_hooks, 'get_event_fds', None)
+        sensor_fds = list(get_event_fds()) if get_event_fds else []
+
+        sel = selectors.DefaultSelector()
+        sel.register(self._wakeup_r, selectors.EVENT_READ)
+        for fd in sensor_fds:
+            sel.register(fd, selectors.EVENT_READ)
+
+        # Interval samples follow absolute monotonic deadlines (next += polling_rate) so the
+        # cadence does not drift by the capture time of each tick.
+        next_deadline = time.monotonic()
+
+        try:
+            while not self._shutdown_flag.is_set():
+                try:
+                    index = self._head % ring_size
+                    stamps[2 * index] = time.monotonic_ns()
+                    stamps[2 * index + 1] = time.time_ns()
+                    self._get_resource_status(index)
+                    self._temporal_markers = self._get_temporal_events()
+                    
+                    # Publish the filled slot instantly
+                    self._head += 1
+
+                except Exception as e:
+                    # Critical logging of sensor failure, but thread persists
+                    print(f"RTOM Monitoring Loop experienced error: {e}")
                 
-                # Update the shared cache instantly
-                RTOM._metrics_cache = telemetry 
+                now = time.monotonic()
+                if now >= next_deadline:
+                    next_deadline += self.polling_rate
+                    if next_deadline <= now:
+                        # Fell more than a period behind (e.g. a slow sensor); resynchronize.
+                        next_deadline = now + self.polling_rate
 
-            except Exception as e:
-                # Critical logging of sensor failure, but thread persists
-                print(f"RTOM Monitoring Loop experienced error: {e}")
-            
-            self._shutdown_flag.wait(self.polling_rate)
+                # Sensors are expected to consume their own readiness when sampled.
+                events = sel.select(timeout=next_deadline - now)
+                if any(key.fd == self._wakeup_r for key, _ in events):
+                    break
+        finally:
+            sel.close()
+            os.close(self._wakeup_r)
             
+    def _apply_thread_scheduling(self):
+        """Applies the configured CPU affinity and real-time policy to the calling (monitor) thread.
+
+        pid 0 addresses the calling thread on Linux. Failures (no CAP_SYS_NICE, unsupported
+        platform, invalid CPU) are reported and the monitor continues under the default scheduler.
+        """
+        if self.affinity_cpu is not None:
+            try:
+                os.sched_setaffinity(0, {int(self.affinity_cpu)})
+            except (AttributeError, OSError, ValueError) as e:
+                print(f"RTOM could not pin monitor thread to CPU {self.affinity_cpu}: {e}")
+
+        if self.realtime_priority is not None:
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(int(self.realtime_priority)))
+            except (AttributeError, OSError, ValueError) as e:
+                print(f"RTOM could not apply SCHED_FIFO priority {self.realtime_priority}: {e}")
+
     def get_real_time_telemetry(self) -> Dict[str, Any]:
         """
-        Returns the current immutable telemetry package instantly from cache.
+        Returns the current telemetry package, built from the most recently published ring slot.
         NON-BLOCKING READ guaranteed.
+
+        Publication is single-producer: only the monitor thread writes slots, and it fills a slot
+        completely before the one `_head` store that publishes it. Readers take no lock; they
+        load `_head` once and read the slot before it, which the producer will not touch again
+        until it has wrapped the whole ring.
         """
-        if not RTOM._metrics_cache:
+        head = self._head
+        if not head:
             return {'status': 'initializing', 'timestamp_utc': time.time()}
-            
-        return RTOM._metrics_cache
+
+        index = (head - 1) % len(self._ring)
+        resource_metrics = self._snapshots[index]
+        if resource_metrics is None:
+            slot = self._ring[index]
+            resource_metrics = {}
+            for column, (group, key) in enumerate(self._ring_fields):
+                resource_metrics.setdefault(group, {})[key] = slot[column]
+
+        return {
+            'timestamp_utc': self._stamps[2 * index + 1] / 1e9,
+            'timestamp_monotonic_ns': self._stamps[2 * index],
+            'resource_metrics': resource_metrics,
+            'temporal_markers': self._temporal_markers
+        }
 
     def shutdown(self):
         """Gracefully stops the monitoring thread, cleaning up resources."""
+        if self._shutdown_flag.is_set():
+            return
         self._shutdown_flag.set()
+
+        # Called from the monitor thread itself: the flag is observed on the next loop check,
+        # so skip the wake write and the (self-)join.
+        if threading.current_thread() is self._monitoring_thread:
+            os.close(self._wakeup_w)
+            return
+
+        try:
+            if _HAS_EVENTFD:
+                os.eventfd_write(self._wakeup_w, 1)
+            else:
+                os.write(self._wakeup_w, b'\x00')
+        except BrokenPipeError:
+            # The monitor already exited and closed the read end of the pipe.
+            pass
+        finally:
+            os.close(self._wakeup_w)
         if self._monitoring_thread.is_alive():
             self._monitoring_thread.join(timeout=1.0)
             
     # --- Sensor methods (Rely on SensorAPI abstraction) ---
-    def _get_resource_status(self) -> Dict[str, Any]: 
-        # Delegation to the abstracted sensor hooks
-        return self._sensor_hooks.get_all_resource_metrics()
+    def _get_resource_status(self, index: int) -> None: 
+        # Delegation to the abstracted sensor hooks; batch readers write into the ring slot in place.
+        if self._read_sensors is None:
+            self._snapshots[index] = self._sensor_hooks.get_all_resource_metrics()
+        else:
+            self._read_sensors(self._ring[index], 0)
         
     def _get_temporal_events(self) -> list: 
         # Placeholder for stage transition markers (e.g., read from an event queue)
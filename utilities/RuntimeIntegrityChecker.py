@@ -1,17 +1,37 @@
 # utilities/RuntimeIntegrityChecker.py
 
+import copy
 import json
+import os
 import sys
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+@lru_cache(maxsize=8)
+def _parse_governance_params(path, mtime_ns, size):
+    """Parses the governance file once per (path, mtime, size) version; the stat fields only key the cache.
+    The result is shared, so it is only handed out through load_governance_params' copies."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 def load_governance_params(path='config/GOVERNANCE_PARAMS.json'):
-    """Loads and validates the governance configuration."""
+    """Loads and validates the governance configuration.
+
+    The parse is cached until the file's mtime or size changes; each caller gets its own deep copy,
+    so updates made to it (e.g. a forced lockdown) do not leak into later loads.
+    """
     try:
-        with open(path, 'r') as f:
-            params = json.load(f)
+        st = os.stat(path)
+        params = _parse_governance_params(path, st.st_mtime_ns, st.st_size)
     except FileNotFoundError:
         print("ERROR: Governance parameters file not found.", file=sys.stderr)
         sys.exit(1)
-    return params
+    return copy.deepcopy(params)
 
 def check_system_compliance(params):
     """
@@ -6,7 +6,21 @@ RTOM is testable and platform-independent by enforcing a strict data retrieval c
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from array import array
+from typing import Dict, Any, MutableSequence, Sequence, Tuple
+
+# Default column layout used by read_all(): one (metric group, metric key) pair per float column.
+# Sensors reporting other metrics override SensorAPI.metric_layout alongside read_all().
+METRIC_LAYOUT: Tuple[Tuple[str, str], ...] = (
+    ('cpu', 'utilization_percent'),
+    ('cpu', 'load_avg_1m'),
+    ('memory', 'used_gb'),
+    ('memory', 'available_percent'),
+    ('io', 'read_iops'),
+    ('io', 'write_iops'),
+    ('network', 'latency_ms'),
+    ('network', 'tx_kbps'),
+)
 
 class SensorAPI(ABC):
     """Base class defining the contract for retrieving instantaneous resource telemetry.
@@ -42,8 +56,40 @@ class SensorAPI(ABC):
             'network': self.get_network_metrics(),
         }
 
+    @property
+    def metric_layout(self) -> Tuple[Tuple[str, str], ...]:
+        """The (metric group, metric key) pair stored in each float column written by read_all()."""
+        return METRIC_LAYOUT
+
+    def read_all(self, out: MutableSequence[float], start: int = 0) -> None:
+        """Writes every metric in metric_layout order into out[start:start + len(metric_layout)].
+
+        This is RTOM's fast per-tick path: concrete sensors should override it to gather all
+        readings in one batch (e.g. a single pass over /proc) and write them in place, without
+        building per-group dicts. RTOM only uses it for sensors that override it; sensors that
+        implement just the four getters are published as their own get_all_resource_metrics()
+        dict. The default here fills the layout from that dict; missing metrics become NaN.
+        """
+        metrics = self.get_all_resource_metrics()
+        for column, (group, key) in enumerate(self.metric_layout, start=start):
+            out[column] = metrics.get(group, {}).get(key, float('nan'))
+
+    def get_event_fds(self) -> Sequence[int]:
+        """Returns file descriptors that become readable when fresh metrics are available
+        (e.g. netlink, perf events, /proc/pressure triggers). RTOM samples as soon as any is
+        readable instead of waiting out its polling interval; the sensor must consume the
+        readiness when sampled. Defaults to none, i.e. pure interval polling.
+        """
+        return ()
+
 class MockSensor(SensorAPI):
     """Default implementation used when no concrete OS/Hypervisor API is provided."""
+
+    # Static readings in METRIC_LAYOUT order, copied into the caller's slot by read_all().
+    _READINGS = array('d', (0.45, 0.55, 15.2, 35.0, 1200, 750, 0.15, 9800))
+
+    def read_all(self, out: MutableSequence[float], start: int = 0) -> None:
+        out[start:start + len(self._READINGS)] = self._READINGS
     
     def get_cpu_metrics(self) -> Dict[str, float]:
         return {'utilization_percent': 0.45, 'load_avg_1m': 0.55}
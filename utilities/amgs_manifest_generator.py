@@ -1,21 +1,68 @@
 #!/usr/bin/env python3
 import hashlib
 import json
+import mmap
 import os
 import sys
+import threading
 import datetime
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, List, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Target system version, usually injected during build/deployment.
 SYSTEM_VERSION = "v94.1_CHR_Lock"
 ARTIFACT_REGISTRY_PATH = 'config/amgs_artifact_registry.json'
 TARGET_MANIFEST_PATH = 'registry/chr_manifest.json'
+# Side-cache of path -> [mtime_ns, size, sha256]; artifacts whose stat fingerprint is unchanged are not rehashed.
+HASH_CACHE_PATH = 'registry/chr_manifest.cache.json'
+# hashlib binds SHA256 to OpenSSL (openssl_sha256) when _hashlib is available; OpenSSL dispatches to the
+# CPU's SHA extensions (SHA-NI / ARMv8 SHA2) at runtime. The builtin fallback has no such acceleration.
+SHA256_OPENSSL_BACKED = hashlib.sha256.__name__.startswith('openssl_')
+
+
+def describe_hash_backend() -> str:
+    """Describes the SHA256 implementation hashlib resolved to, for the generator's startup banner."""
+    if not SHA256_OPENSSL_BACKED:
+        return "builtin (no OpenSSL; hardware SHA acceleration unavailable)"
+    try:
+        import ssl
+        return ssl.OPENSSL_VERSION
+    except ImportError:
+        return "OpenSSL"
+
+
+# Per-worker-thread empty SHA256 state; each file hash starts from a cheap copy() of it.
+_hasher_local = threading.local()
+
+
+def _new_sha256() -> Any:
+    """Returns a fresh SHA256 hasher cloned from this thread's cached empty template."""
+    template = getattr(_hasher_local, 'sha256', None)
+    if template is None:
+        template = _hasher_local.sha256 = hashlib.sha256()
+    return template.copy()
+
+
+# hashlib.file_digest is available from Python 3.11.
+_file_digest = getattr(hashlib, 'file_digest', None)
+
+
+# Upper bound on concurrent artifact hashes; hashlib releases the GIL, so threads scale with disk concurrency.
+MAX_HASH_WORKERS = 8
 
 
 def load_config(path: str) -> Optional[Any]:
     """Loads a JSON configuration file robustly, handling standard file and parsing errors."""
     try:
+        if orjson is not None:
+            with open(path, 'rb') as f:
+                return orjson.loads(f.read())
         with open(path, 'r') as f:
             return json.load(f)
     except FileNotFoundError:
@@ -43,23 +90,92 @@ def get_governing_artifacts() -> Optional[List[str]]:
 
 
 def calculate_sha256(file_path: str) -> Optional[str]:
-    """Calculates SHA256 hash for a given file path using buffered reading."""
-    hasher = hashlib.sha256()
-    buffer_size = 65536 # 64KB buffer maintained for I/O efficiency
-    
+    """Calculates SHA256 hash for a given file path.
+
+    Uses hashlib.file_digest (Python 3.11+), whose read loop reuses one preallocated buffer
+    (readinto, no per-chunk bytes objects) and releases the GIL inside each update; older
+    runtimes hash the memory-mapped file in a single update.
+    """
     try:
         with open(file_path, 'rb') as f:
-            while True:
-                chunk = f.read(buffer_size)
-                if not chunk:
-                    break
-                hasher.update(chunk)
-        return hasher.hexdigest()
-    except (FileNotFoundError, IOError):
+            if _file_digest is not None:
+                return _file_digest(f, _new_sha256).hexdigest()
+
+            hasher = _new_sha256()
+            # Zero-length files cannot be mapped; their digest is that of the empty input.
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+            return hasher.hexdigest()
+    except (OSError, ValueError):
         # Consolidated error handling; specific error reporting is handled by the caller (generate_chr_manifest)
         return None
 
 
+def load_hash_cache() -> Dict[str, List[Any]]:
+    """Loads the artifact fingerprint cache. A missing or unreadable cache is treated as empty."""
+    try:
+        with open(HASH_CACHE_PATH, 'rb') as f:
+            data = f.read()
+        cache = orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_hash_cache(cache: Dict[str, List[Any]]) -> None:
+    """Persists the artifact fingerprint cache. Failure only costs a full rehash on the next run."""
+    try:
+        with open(HASH_CACHE_PATH, 'wb') as f:
+            f.write(orjson.dumps(cache) if orjson is not None else json.dumps(cache).encode('utf-8'))
+    except OSError as e:
+        print(f"  [WARNING] Could not write hash cache {HASH_CACHE_PATH}: {e}", file=sys.stderr)
+
+
+def hash_artifacts(paths: List[str], cache: Dict[str, List[Any]]) -> List[Optional[str]]:
+    """
+    Returns the SHA256 of each path, in order (None for missing/unreadable files).
+    Digests are reused from `cache` when the file's (mtime_ns, size) still matches; only the
+    remaining files are hashed, concurrently. `cache` is updated in place.
+    """
+    file_hashes: List[Optional[str]] = [None] * len(paths)
+    pending: List[int] = []
+    fingerprints: Dict[int, List[int]] = {}
+
+    for i, path in enumerate(paths):
+        try:
+            st = os.stat(path)
+        except OSError:
+            cache.pop(path, None)
+            continue
+        fingerprint = [st.st_mtime_ns, st.st_size]
+        entry = cache.get(path)
+        if isinstance(entry, list) and len(entry) == 3 and entry[:2] == fingerprint:
+            file_hashes[i] = entry[2]
+        else:
+            pending.append(i)
+            fingerprints[i] = fingerprint
+
+    if pending:
+        workers = max(1, min(MAX_HASH_WORKERS, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for i, file_hash in zip(pending, executor.map(calculate_sha256, [paths[i] for i in pending])):
+                file_hashes[i] = file_hash
+                if file_hash:
+                    cache[paths[i]] = [*fingerprints[i], file_hash]
+                else:
+                    cache.pop(paths[i], None)
+
+    return file_hashes
+
+
+def serialize_manifest(manifest: Dict[str, Any]) -> bytes:
+    """Serializes the manifest to byte-stable JSON (2-space indent, sorted keys) for hashing and storage."""
+    if orjson is not None:
+        return orjson.dumps(manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(manifest, indent=2, sort_keys=True, ensure_ascii=False).encode('utf-8')
+
+
 def generate_chr_manifest() -> bool:
     """
     Generates the Configuration Hash Registry (CHR) manifest.
@@ -81,18 +197,28 @@ def generate_chr_manifest() -> bool:
             "artifact_source": ARTIFACT_REGISTRY_PATH, 
             "lock_type": "AMGS_Sovereign_Integrity_Lock"
         },
-        "artifacts": {}
+        "artifacts": []
     }
     
+    artifact_hashes: Dict[str, str] = {}
     missing_artifacts: List[str] = []
     
     print(f"--- AMGS Manifest Generator ({SYSTEM_VERSION}): Hashing Critical Artifacts ({len(governing_artifacts)} items) ---")
+    print(f"  SHA256 backend: {describe_hash_backend()}")
+    if not SHA256_OPENSSL_BACKED:
+        print("  [WARNING] hashlib is not OpenSSL-backed; artifact hashing will be significantly slower.", file=sys.stderr)
     
-    for path in governing_artifacts:
-        file_hash = calculate_sha256(path)
-        
+    # Ensure the registry directory exists
+    os.makedirs(os.path.dirname(TARGET_MANIFEST_PATH), exist_ok=True)
+    
+    # Hash changed artifacts concurrently; results stay in registry order for the reporting below.
+    hash_cache = load_hash_cache()
+    file_hashes = hash_artifacts(governing_artifacts, hash_cache)
+    save_hash_cache(hash_cache)
+    
+    for path, file_hash in zip(governing_artifacts, file_hashes):
         if file_hash:
-            manifest['artifacts'][path] = file_hash
+            artifact_hashes[path] = file_hash
         else:
             missing_artifacts.append(path)
             print(f"  [CRITICAL FAILURE] Missing/Unreadable artifact: {path}", file=sys.stderr)
@@ -102,13 +228,16 @@ def generate_chr_manifest() -> bool:
         print("\n[INTEGRITY FAILURE] CHR Generation Halted. System artifacts missing.")
         return False
     
-    # Ensure the registry directory exists
-    os.makedirs(os.path.dirname(TARGET_MANIFEST_PATH), exist_ok=True)
+    # Artifacts are emitted as a path-sorted list of entries so consumers can stream-verify
+    # them in a deterministic order without materializing a path-keyed object.
+    manifest['artifacts'] = [
+        {'path': path, 'sha256': file_hash} for path, file_hash in sorted(artifact_hashes.items())
+    ]
     
     try:
         # Lock the generated manifest
-        with open(TARGET_MANIFEST_PATH, 'w') as f:
-            json.dump(manifest, f, indent=4)
+        with open(TARGET_MANIFEST_PATH, 'wb') as f:
+            f.write(serialize_manifest(manifest))
         
         print(f"\n[SUCCESS] CHR Manifest ({len(manifest['artifacts'])} artifacts) locked at: {TARGET_MANIFEST_PATH}")
         return True
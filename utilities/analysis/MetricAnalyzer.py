@@ -1,6 +1,180 @@
-from typing import Dict, List, Tuple
+import hashlib
+import math
+from collections import OrderedDict
+from statistics import NormalDist
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 import numpy as np
-from statsmodels.tsa.api import ExponentialSmoothing, SimpleExpSmoothing
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Bound on memoized forecasts per MetricAnalyzer (a few metrics x a few step horizons).
+FORECAST_CACHE_SIZE = 32
+
+
+def _ses_kernel(y: Sequence[float], alpha: float) -> Tuple[float, float, float]:
+    """
+    Runs the Simple Exponential Smoothing recurrence l = alpha*y + (1-alpha)*l over the series.
+    Returns: (final level, residual variance, mean one-step residual)
+    """
+    one_minus_alpha = 1.0 - alpha
+    n = len(y)
+    level = y[0]
+    sse = 0.0
+    resid_sum = 0.0
+    for i in range(1, n):
+        r = y[i] - level
+        sse += r * r
+        resid_sum += r
+        level = alpha * y[i] + one_minus_alpha * level
+    return level, sse / (n - 1), resid_sum / (n - 1)
+
+
+if njit is not None:
+    # Compiled recurrence over a contiguous float64 array; warmed at import so the first forecast
+    # does not pay JIT compilation (cache=True persists the machine code across processes).
+    _ses_kernel_jit = njit(cache=True)(_ses_kernel)
+    _ses_kernel_jit(np.zeros(16), 0.5)
+
+    def _fit_ses(y: np.ndarray, alpha: float) -> Tuple[float, float, float]:
+        return _ses_kernel_jit(y, alpha)
+else:
+    def _fit_ses(y: np.ndarray, alpha: float) -> Tuple[float, float, float]:
+        # Interpreted fallback: indexing a list of Python floats beats indexing an ndarray element-wise.
+        return _ses_kernel(y.tolist(), alpha)
+
+
+def _ses_kernel_batch(Y: np.ndarray, alpha: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    _ses_kernel over every row of a (series, time) array at once: the recurrence steps through
+    time while each step updates all series with one vectorized operation.
+    Returns: (final levels, residual variances, mean one-step residuals), one entry per row.
+    """
+    one_minus_alpha = 1.0 - alpha
+    n = Y.shape[1]
+    level = Y[:, 0].copy()
+    sse = np.zeros_like(level)
+    resid_sum = np.zeros_like(level)
+    r = np.empty_like(level)
+    for i in range(1, n):
+        y = Y[:, i]
+        np.subtract(y, level, out=r)
+        sse += r * r
+        resid_sum += r
+        level *= one_minus_alpha
+        level += alpha * y
+    return level, sse / (n - 1), resid_sum / (n - 1)
+
+
+def _ses_kernel_multi(Y: np.ndarray, alpha: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Scalar-loop form of _ses_kernel_batch for compilation: one fused pass over time that advances
+    every series' state in the same iteration.
+    """
+    m, n = Y.shape
+    one_minus_alpha = 1.0 - alpha
+    level = Y[:, 0].copy()
+    sse = np.zeros(m)
+    resid_sum = np.zeros(m)
+    for i in range(1, n):
+        for k in range(m):
+            r = Y[k, i] - level[k]
+            sse[k] += r * r
+            resid_sum[k] += r
+            level[k] = alpha * Y[k, i] + one_minus_alpha * level[k]
+    return level, sse / (n - 1), resid_sum / (n - 1)
+
+
+if njit is not None:
+    _ses_kernel_multi_jit = njit(cache=True)(_ses_kernel_multi)
+    _ses_kernel_multi_jit(np.zeros((2, 16)), 0.5)
+    _fit_ses_multi = _ses_kernel_multi_jit
+else:
+    # Interpreted fallback: vectorize across series instead of looping over them in Python.
+    _fit_ses_multi = _ses_kernel_batch
+
+
+class _SESState:
+    """
+    Running form of _ses_kernel for one metric stream: each sample updates the level and the
+    one-step residual sums in O(1), yielding the same moments as a full pass over the history.
+    """
+    __slots__ = ('n', 'level', 'sse', 'resid_sum')
+
+    def __init__(self):
+        self.n = 0
+        self.level = 0.0
+        self.sse = 0.0
+        self.resid_sum = 0.0
+
+    def update(self, x: float, alpha: float) -> None:
+        self.n += 1
+        if self.n == 1:
+            self.level = x
+            return
+        r = x - self.level
+        self.sse += r * r
+        self.resid_sum += r
+        self.level += alpha * r  # == alpha*x + (1-alpha)*level
+
+    @classmethod
+    def from_moments(cls, n: int, level: float, resid_var: float, resid_mean: float) -> "_SESState":
+        """Rebuilds the running state from the output of a full _ses_kernel pass over n samples."""
+        state = cls()
+        state.n = n
+        state.level = level
+        state.sse = resid_var * (n - 1)
+        state.resid_sum = resid_mean * (n - 1)
+        return state
+
+    def moments(self) -> Tuple[float, float, float]:
+        """Returns: (final level, residual variance, mean one-step residual)"""
+        return self.level, self.sse / (self.n - 1), self.resid_sum / (self.n - 1)
+
+class MetricHistory:
+    """
+    Fixed-capacity float32 ring buffer holding the most recent samples of one metric.
+    append() overwrites the oldest sample once full, so memory and per-fit work stay bounded by `cap`.
+    """
+    __slots__ = ('buf', 'n', 'head')
+
+    def __init__(self, cap: int):
+        self.buf = np.empty(cap, np.float32)
+        self.n = 0
+        self.head = 0
+
+    def append(self, x: float) -> None:
+        self.buf[self.head] = x
+        self.head = (self.head + 1) % len(self.buf)
+        if self.n < len(self.buf):
+            self.n += 1
+
+    def __len__(self) -> int:
+        return self.n
+
+    def window(self) -> np.ndarray:
+        """Returns the buffered samples oldest-first as one contiguous array."""
+        if self.n < len(self.buf):
+            return self.buf[:self.n]
+        return np.concatenate((self.buf[self.head:], self.buf[:self.head]))
+
+
+MetricSeries = Union[Sequence[float], MetricHistory]
+
+
+def _as_series(data: MetricSeries) -> np.ndarray:
+    """Converts a history (list of floats or MetricHistory) to a contiguous float64 array in one copy."""
+    if isinstance(data, MetricHistory):
+        data = data.window()
+    return np.asarray(data, dtype=np.float64)
+
+
+def _window_digest(y: np.ndarray) -> bytes:
+    """Digest of a float64 window, identifying the exact samples an incremental fit has consumed."""
+    return hashlib.blake2b(np.ascontiguousarray(y), digest_size=16).digest()
+
 
 class MetricAnalyzer:
     """
@@ -14,10 +188,26 @@ class MetricAnalyzer:
         self.confidence_level = confidence_level
         # Require slightly more than just the window for stable variance estimation
         self.min_data_points = self.smoothing_window + 5 
+        # Calculate alpha based on smoothing window (standard approximation 2/(N+1))
+        self.alpha = 2 / (self.smoothing_window + 1)
+        # Two-sided normal critical value for confidence_level, computed once rather than per forecast
+        self._z = NormalDist().inv_cdf(1 - (1 - self.confidence_level) / 2)
+        # Per-metric running SES state fed by update(); independent of analyze_gtcm_performance().
+        self._state: Dict[str, _SESState] = {}
+        # Per-metric SES state of the histories passed to analyze_gtcm_performance(), with the digest of
+        # the window it consumed. A later call whose history starts with that exact window only folds in
+        # the appended samples; any other history is refit in full.
+        self._history_state: Dict[str, Tuple[_SESState, bytes]] = {}
+        # LRU of forecasts keyed on (metric, steps, exact history bytes); see _fit_and_forecast_metric().
+        self._forecast_cache: "OrderedDict[tuple, Tuple[float, float, float]]" = OrderedDict()
 
-    def _fit_and_forecast_metric(self, data: List[float], steps: int = 1) -> Tuple[float, float, float]:
+    def _fit_and_forecast_metric(self, data: MetricSeries, steps: int = 1, metric: Optional[str] = None) -> Tuple[float, float, float]:
         """
         Fits data using Exponential Smoothing and forecasts the metric value and its confidence interval.
+        When `metric` is given and `data` extends the exact history of that metric's previous fit, the
+        fit resumes from the stored state and only processes the appended samples; otherwise it refits
+        in full. A MetricHistory is a sliding window and is always refit in full; its capacity bounds
+        that cost.
         Returns: (Forecasted Value, Lower Bound CI, Upper Bound CI)
         """
         if len(data) < self.min_data_points:
@@ -26,33 +216,72 @@ class MetricAnalyzer:
                 f"Insufficient data ({len(data)} points) for robust forecasting. Need at least {self.min_data_points}."
             )
 
-        # Calculate alpha based on smoothing window (standard approximation 2/(N+1))
-        alpha = 2 / (self.smoothing_window + 1)
+        cache_metric = metric
+        if isinstance(data, MetricHistory):
+            data = _as_series(data)
+            metric = None
+
+        # The key holds the full window's bytes, so a hit means identical input data (one C-level
+        # hash and compare instead of a refit); the metric keeps equal histories of S-01/S-02 apart.
+        y = _as_series(data)
+        key = (cache_metric, steps, y.tobytes())
+        cached = self._forecast_cache.get(key)
+        if cached is not None:
+            self._forecast_cache.move_to_end(key)
+            return cached
+
+        alpha = self.alpha
         
         # Using Simple Exponential Smoothing (SES) as we are not explicitly modeling Trend or Seasonality 
         # for a single metric time series analysis, making the results easier to interpret and less prone to overfitting.
-        model = SimpleExpSmoothing(data, initialization_method="estimated").fit(
-            smoothing_level=alpha,
-            optimized=False, # Use calculated alpha instead of optimization
-            remove_bias=True
-        )
-        
-        # Forecast 1 step ahead (next cycle)
-        forecast_results = model.get_forecast(steps=steps)
-        
-        mean_forecast = forecast_results.predicted_mean.iloc[steps - 1]
-        
-        # Calculate confidence interval
-        alpha_ci = 1 - self.confidence_level
+        # The recurrence is evaluated directly (JIT-compiled when numba is available) rather than
+        # through a fitted model object.
+        state = self._resumable_state(metric, y) if metric is not None else None
+        if state is not None:
+            # SES is a recursive filter: fold in only the samples appended since the last fit.
+            for x in y[state.n:].tolist():
+                state.update(x, alpha)
+            level, resid_var, resid_mean = state.moments()
+        else:
+            level, resid_var, resid_mean = _fit_ses(y, alpha)
+            state = _SESState.from_moments(len(y), level, resid_var, resid_mean)
+        if metric is not None:
+            self._history_state[metric] = (state, _window_digest(y))
+        forecast = self._forecast_interval(level, resid_var, resid_mean, steps)
+
+        self._forecast_cache[key] = forecast
+        if len(self._forecast_cache) > FORECAST_CACHE_SIZE:
+            self._forecast_cache.popitem(last=False)
+        return forecast
+
+    def _resumable_state(self, metric: str, y: np.ndarray) -> Optional[_SESState]:
+        """Returns the metric's stored SES state if `y` starts with the exact window it was fit on."""
+        entry = self._history_state.get(metric)
+        if entry is None:
+            return None
+        state, digest = entry
+        if state.n > len(y) or _window_digest(y[:state.n]) != digest:
+            return None
+        return state
+
+    def _forecast_interval(self, level: float, resid_var: float, resid_mean: float, steps: int = 1) -> Tuple[float, float, float]:
+        """
+        Turns fitted SES moments into a forecast and its confidence interval.
+        Returns: (Forecasted Value, Lower Bound CI, Upper Bound CI)
+        """
+        alpha = self.alpha
+
+        # Flat SES forecast, bias-corrected by the mean one-step residual
+        mean_forecast = level + resid_mean
         
-        # Fetch confidence bounds
-        ci_frame = forecast_results.conf_int(alpha=alpha_ci)
-        lower_bound = ci_frame['lower'].iloc[steps - 1]
-        upper_bound = ci_frame['upper'].iloc[steps - 1]
+        # Calculate confidence interval: SES h-step variance is sigma^2 * (1 + (h-1) * alpha^2)
+        half_width = self._z * math.sqrt(resid_var * (1 + (steps - 1) * alpha ** 2))
+        lower_bound = mean_forecast - half_width
+        upper_bound = mean_forecast + half_width
         
         return mean_forecast, lower_bound, upper_bound
 
-    def analyze_gtcm_performance(self, history: Dict[str, list]) -> Dict[str, float]:
+    def analyze_gtcm_performance(self, history: Dict[str, MetricSeries]) -> Dict[str, float]:
         """
         Analyzes S-01 (Efficiency) and S-02 (Exposure) history using predictive analytics 
         to suggest forward-looking threshold adjustments.
@@ -62,24 +291,114 @@ class MetricAnalyzer:
         - S-02 Ceiling: Use the Upper Confidence Interval (UCI) to capture maximum expected risk.
         """
         suggestions = {}
+        self._seed_paired_fits(history)
         
         for metric, data in history.items():
             if metric not in ['S-01', 'S-02']:
                 continue
                 
             try:
-                pred, lower_ci, upper_ci = self._fit_and_forecast_metric(data)
-                
-                if metric == 'S-01':
-                    # Suggest utility floor (Minimum acceptable efficiency)
-                    suggestions['suggested_s01_floor'] = round(lower_ci, 4)
-                
-                elif metric == 'S-02':
-                    # Suggest risk ceiling (Maximum acceptable exposure)
-                    suggestions['suggested_s02_ceiling'] = round(upper_ci, 4)
+                pred, lower_ci, upper_ci = self._fit_and_forecast_metric(data, metric=metric)
+                self._add_suggestion(suggestions, metric, lower_ci, upper_ci)
 
             except IndexError: # Handled by _fit_and_forecast_metric
                 # Skip calculation if insufficient data
                 continue
 
         return suggestions
+
+    def _seed_paired_fits(self, history: Dict[str, MetricSeries]) -> None:
+        """
+        When S-01 and S-02 both need a full fit and have the same length, fits them together in one
+        (2, N) pass and seeds their incremental state, so the per-metric forecasts below resume from it.
+        """
+        pair = [history.get('S-01'), history.get('S-02')]
+        if any(data is None or isinstance(data, MetricHistory) for data in pair):
+            return
+        n = len(pair[0])
+        if n != len(pair[1]) or n < self.min_data_points:
+            return
+        ys = [_as_series(data) for data in pair]
+        if any(self._resumable_state(metric, y) is not None for metric, y in zip(('S-01', 'S-02'), ys)):
+            return
+
+        levels, resid_vars, resid_means = _fit_ses_multi(np.stack(ys), self.alpha)
+        for k, metric in enumerate(('S-01', 'S-02')):
+            state = _SESState.from_moments(n, float(levels[k]), float(resid_vars[k]), float(resid_means[k]))
+            self._history_state[metric] = (state, _window_digest(ys[k]))
+
+    def forecast_many(self, history: Dict[str, MetricSeries], steps: int = 1) -> Dict[str, Tuple[float, float, float]]:
+        """
+        Fits and forecasts many metric series together. Series of equal length are stacked into one
+        (series, time) array and smoothed in a single vectorized pass instead of one fit per series.
+        Series with insufficient data are omitted from the result.
+        Returns: {metric: (Forecasted Value, Lower Bound CI, Upper Bound CI)}
+        """
+        by_length: Dict[int, List[str]] = {}
+        for metric, data in history.items():
+            if len(data) >= self.min_data_points:
+                by_length.setdefault(len(data), []).append(metric)
+
+        alpha = self.alpha
+        z = self._z
+        forecasts: Dict[str, Tuple[float, float, float]] = {}
+        for metrics in by_length.values():
+            Y = np.stack([_as_series(history[metric]) for metric in metrics])
+            level, resid_var, resid_mean = _fit_ses_multi(Y, alpha)
+
+            # Same forecast and interval as _forecast_interval, evaluated for all rows at once
+            mean_forecast = level + resid_mean
+            half_width = z * np.sqrt(resid_var * (1 + (steps - 1) * alpha ** 2))
+            rows = zip(mean_forecast.tolist(), (mean_forecast - half_width).tolist(), (mean_forecast + half_width).tolist())
+            forecasts.update(zip(metrics, rows))
+
+        return forecasts
+
+    def reset_state(self, metric: Optional[str] = None) -> None:
+        """
+        Discards the incremental fit state of `metric` (or of every metric), forcing a full refit on the
+        next analysis. Replaced histories are detected and refit anyway; this only frees the state.
+        """
+        if metric is None:
+            self._history_state.clear()
+        else:
+            self._history_state.pop(metric, None)
+        # The forecast cache is keyed on exact input data, so none of its entries can be stale.
+
+    def update(self, metric: str, value: float) -> None:
+        """
+        Feeds one new sample of a metric into its running SES state in O(1).
+        Intended for rolling telemetry, where re-fitting the full history on every call is wasteful.
+        """
+        state = self._state.get(metric)
+        if state is None:
+            state = self._state[metric] = _SESState()
+        state.update(float(value), self.alpha)
+
+    def analyze_incremental(self) -> Dict[str, float]:
+        """
+        Same suggestions as analyze_gtcm_performance(), computed from the running state built by
+        update() instead of a full pass over the history.
+        """
+        suggestions = {}
+
+        for metric in ('S-01', 'S-02'):
+            state = self._state.get(metric)
+            if state is None or state.n < self.min_data_points:
+                # Skip calculation if insufficient data
+                continue
+
+            pred, lower_ci, upper_ci = self._forecast_interval(*state.moments())
+            self._add_suggestion(suggestions, metric, lower_ci, upper_ci)
+
+        return suggestions
+
+    @staticmethod
+    def _add_suggestion(suggestions: Dict[str, float], metric: str, lower_ci: float, upper_ci: float) -> None:
+        if metric == 'S-01':
+            # Suggest utility floor (Minimum acceptable efficiency)
+            suggestions['suggested_s01_floor'] = round(lower_ci, 4)
+
+        elif metric == 'S-02':
+            # Suggest risk ceiling (Maximum acceptable exposure)
+            suggestions['suggested_s02_ceiling'] = round(upper_ci, 4)
@@ -1,9 +1,96 @@
 # utilities/configuration_schema_validator.py
 
 import os
+import sys
+import mmap
 import yaml
 import json
-from jsonschema import validate, ValidationError
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import Draft4Validator, Draft6Validator, Draft7Validator, validator_for
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional code-generating validator for the success path; jsonschema stays the reference implementation.
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# libyaml's C loader when PyYAML was built against it; otherwise the pure-Python safe loader.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Schema preloading is I/O-bound (file reads release the GIL), so a small thread pool hides disk latency.
+SCHEMA_PRELOAD_WORKERS = 8
+
+
+# Cached per artifact: (schema, jsonschema validator, fastjsonschema function or None).
+SchemaEntry = Tuple[dict, Any, Optional[Callable[[Any], Any]]]
+
+# Files above this size are parsed from a read-only memory map instead of being read into a bytes copy.
+MMAP_THRESHOLD_BYTES = 1 << 20
+
+
+def _load_yaml(buffer):
+    # PyYAML decodes bytes itself (UTF-8/16 with BOM detection) and reads an mmap like a file.
+    return yaml.load(buffer, Loader=_YamlLoader)
+
+
+def _load_json(buffer):
+    if orjson is not None:
+        with memoryview(buffer) as view:
+            return orjson.loads(view)
+    return json.loads(bytes(buffer))
+
+
+# jsonschema validator classes whose draft fastjsonschema implements; other drafts (2019-09, 2020-12)
+# and schemas without an explicit $schema use jsonschema only.
+_FAST_DRAFTS = (Draft4Validator, Draft6Validator, Draft7Validator)
+
+
+def _compile_fast_validator(schema: dict, validator_cls: type) -> Optional[Callable[[Any], Any]]:
+    """
+    Compiles the schema into a fastjsonschema function, or returns None when fastjsonschema is not
+    installed or cannot handle the schema. Formats are not enforced and defaults are not filled in,
+    matching the jsonschema path.
+
+    The fast path must accept exactly what `validator_cls` accepts, so it is only compiled when the
+    schema's $schema names a draft both libraries implement: fastjsonschema reads the draft from
+    $schema (defaulting to draft-07), jsonschema's validator_for() defaults to the latest draft.
+    """
+    if fastjsonschema is None:
+        return None
+    if not isinstance(schema.get('$schema'), str) or validator_cls not in _FAST_DRAFTS:
+        return None
+    try:
+        return fastjsonschema.compile(schema, use_formats=False, use_default=False)
+    except fastjsonschema.JsonSchemaException:
+        return None
+
+
+def _parse_file(path: str, loader) -> Any:
+    """Reads the file at `path` as bytes and parses it with `loader`, memory-mapping large files."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return loader(mm)
+        return loader(f.read())
+
+__all__ = [
+    'ConfigurationError',
+    'SchemaNotFoundError',
+    'ConfigurationFileError',
+    'ConfigurationIntegrityError',
+    'ConfigurationSchemaValidator',
+]
 
 # --- Custom Exception Hierarchy ---
 
@@ -51,29 +138,34 @@ class ConfigurationSchemaValidator:
     Enforces GAX governance standards by validating all core configuration 
     artifacts against defined JSON schemas using a centralized master index.
     
-    Implements schema caching for efficiency.
+    Implements schema caching for efficiency: each schema is checked and compiled into a
+    validator once, and the validator is reused for every artifact validated against it.
     """
     
     # Supported file types and their loading functions
     LOADERS = {
-        '.json': json.load,
-        '.yaml': yaml.safe_load,
-        '.yml': yaml.safe_load,
+        '.json': _load_json,
+        '.yaml': _load_yaml,
+        '.yml': _load_yaml,
     }
 
-    def __init__(self, gax_master_spec_path: str):
+    def __init__(self, gax_master_spec_path: str, strict_preload: bool = True):
         """
-        Initializes the validator by loading the centralized schema index.
+        Initializes the validator by loading the centralized schema index and preloading every
+        schema it references.
+        
+        Args:
+            gax_master_spec_path: Path to the GAX master schema index.
+            strict_preload: If True, a missing or malformed schema raises here, at gate startup.
+                If False, preload failures are deferred until that artifact is validated.
         """
-        if not os.path.exists(gax_master_spec_path):
+        try:
+            # Assuming the index maps artifact names to schema file paths
+            self.gax_master_schema_index = _parse_file(gax_master_spec_path, _load_yaml)
+        except FileNotFoundError as e:
             raise FileNotFoundError(
                 f"[GAX Integrity Failure] Master Spec index not found at {gax_master_spec_path}"
-            )
-            
-        try:
-            with open(gax_master_spec_path, 'r', encoding='utf-8') as f:
-                # Assuming the index maps artifact names to schema file paths
-                self.gax_master_schema_index = yaml.safe_load(f)
+            ) from e
         except Exception as e:
             raise ConfigurationFileError(
                 f"Failed to load GAX Master Schema Index from {gax_master_spec_path}: {e}",
@@ -83,14 +175,54 @@ class ConfigurationSchemaValidator:
         # Infer the schema root directory from the master index location using absolute path
         self.schema_directory = os.path.dirname(os.path.abspath(gax_master_spec_path))
         self._schema_cache = {}
+        self._preload_schemas(strict_preload)
 
-    def _get_schema(self, artifact_name: str) -> dict:
+    def _preload_schemas(self, strict: bool) -> None:
         """
-        Retrieves the validation schema, using a cache if already loaded.
+        Loads and compiles every schema in the master index concurrently, so validate_configuration()
+        performs no schema I/O.
+        """
+        if not isinstance(self.gax_master_schema_index, dict):
+            return
+        names = list(self.gax_master_schema_index)
+        if not names:
+            return
+
+        def load(artifact_name):
+            try:
+                return self._load_schema(artifact_name)
+            except ConfigurationError:
+                if strict:
+                    raise
+                return None
+
+        workers = min(SCHEMA_PRELOAD_WORKERS, len(names))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for artifact_name, entry in zip(names, executor.map(load, names)):
+                if entry is not None:
+                    # Interned keys let callers passing literal artifact names hit the cache on an
+                    # identity compare instead of a full string compare.
+                    if isinstance(artifact_name, str):
+                        artifact_name = sys.intern(artifact_name)
+                    self._schema_cache[artifact_name] = entry
+
+    def _get_schema(self, artifact_name: str) -> SchemaEntry:
+        """
+        Retrieves the validation schema and its compiled validators, using a cache if already loaded.
+        """
+        # Single lookup on the hot (cache hit) path; cached entries are never None.
+        entry = self._schema_cache.get(artifact_name)
+        if entry is not None:
+            return entry
+        
+        entry = self._load_schema(artifact_name)
+        self._schema_cache[artifact_name] = entry
+        return entry
+
+    def _load_schema(self, artifact_name: str) -> SchemaEntry:
+        """
+        Reads, checks and compiles the schema mapped to artifact_name (uncached).
         """
-        if artifact_name in self._schema_cache:
-            return self._schema_cache[artifact_name]
-            
         schema_path_relative = self.gax_master_schema_index.get(artifact_name, None)
         
         if not schema_path_relative:
@@ -100,23 +232,25 @@ class ConfigurationSchemaValidator:
             )
             
         full_path = os.path.join(self.schema_directory, schema_path_relative)
-        
-        if not os.path.exists(full_path):
-             raise SchemaNotFoundError(
-                f"Schema file defined for '{artifact_name}' not found.",
-                artifact_name=artifact_name,
-                lookup_path=full_path
-            )
 
         try:
-            # Use yaml.safe_load for robustness against both JSON and YAML schemas
-            with open(full_path, 'r', encoding='utf-8') as f:
-                schema_content = yaml.safe_load(f)
-                if not isinstance(schema_content, dict):
-                    raise ValueError("Schema content is malformed or empty (not a root object).")
+            # Use the YAML safe loader for robustness against both JSON and YAML schemas
+            schema_content = _parse_file(full_path, _load_yaml)
+            if not isinstance(schema_content, dict):
+                raise ValueError("Schema content is malformed or empty (not a root object).")
+            
+            # Resolve the draft from $schema (latest if absent) and reject malformed schemas here,
+            # once, instead of on every validate() call.
+            validator_cls = validator_for(schema_content)
+            validator_cls.check_schema(schema_content)
             
-            self._schema_cache[artifact_name] = schema_content
-            return schema_content
+            return schema_content, validator_cls(schema_content), _compile_fast_validator(schema_content, validator_cls)
+        except FileNotFoundError as e:
+            raise SchemaNotFoundError(
+                f"Schema file defined for '{artifact_name}' not found.",
+                artifact_name=artifact_name,
+                lookup_path=full_path
+            ) from e
         except Exception as e:
             raise ConfigurationFileError(
                 f"Error loading schema file {full_path}: {e}", 
@@ -152,22 +286,33 @@ class ConfigurationSchemaValidator:
 
         # 2. Load Configuration Data
         try:
-            with open(config_artifact_path, 'r', encoding='utf-8') as f:
-                config_data = loader(f)
+            config_data = _parse_file(config_artifact_path, loader)
         except Exception as e:
             raise ConfigurationFileError(
                 f"Failed to load/parse artifact {config_artifact_path} as {ext} file: {e}",
                 file_path=config_artifact_path
             ) from e
 
-        # 3. Retrieve Schema (handles caching)
-        schema = self._get_schema(artifact_name) 
+        # 3. Retrieve Schema and its compiled validators (handles caching)
+        _, validator, fast_validate = self._get_schema(artifact_name) 
         
         # 4. Perform Validation
         # Removed internal print statements, relying on external logging/exception reporting.
         
+        if fast_validate is not None:
+            try:
+                fast_validate(config_data)
+                return True
+            except fastjsonschema.JsonSchemaValueException:
+                # Rejections are re-checked by jsonschema, which produces the detailed error report
+                # and remains authoritative if the two implementations disagree.
+                pass
+        
         try:
-            validate(instance=config_data, schema=schema)
+            # Same error selection as jsonschema.validate(), without rebuilding the validator per call
+            error = best_match(validator.iter_errors(config_data))
+            if error is not None:
+                raise error
             return True
             
         except ValidationError as e:
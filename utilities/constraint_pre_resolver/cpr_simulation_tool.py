@@ -2,10 +2,36 @@
 # Stage S09 Execution - Refactored for Robustness and Traceability
 
 import json
+import os
+import shutil
 import sys
 import time
 import logging
-from typing import Dict, Any, Optional, Union, List
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, Any, FrozenSet, Iterable, Optional, Union, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional: compact binary reports for machine-only consumers (report_format='msgpack').
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Optional: compiles configured artifact schemas into plain Python validators.
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 # --- 0. Logging Configuration ---
 
@@ -25,41 +51,252 @@ class ArtifactLoadingError(CPRToolError):
         super().__init__(message)
         self.error_code = error_code
 
+class ACVMUnavailableError(CPRToolError):
+    """Raised when the ACVMProcessor component cannot be imported."""
+    pass
+
 # --- 2. Type Aliases for Clarity ---
 
-ArtifactMap = Dict[str, Union[str, Dict[str, Any]]]
+ArtifactMap = Dict[str, Union[str, Dict[str, Any], Iterable[Any]]]
 ACVMConfig = Dict[str, Any]
 SimulationResults = Dict[str, bool] # Maps constraint ID to success status
 SimulationReport = Dict[str, Any]
 
+# Artifacts above this size are streamed (ijson) when only some of their top-level keys are requested.
+STREAMING_THRESHOLD_BYTES = 512 * 1024
+
+# Record-streamed artifacts (see CPRSimulator.streamed_artifacts) above this size are yielded record by
+# record instead of being parsed whole, bounding peak memory to one record.
+RECORD_STREAMING_THRESHOLD_BYTES = 8 * 1024 * 1024
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError; ijson reports its own error type.
+_JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson is not None else (json.JSONDecodeError,)
+
+# Artifacts are loaded concurrently; the work is dominated by file I/O, which releases the GIL.
+MAX_ARTIFACT_LOAD_WORKERS = 8
+
+# Supported report encodings, keyed to the file extension used for the default report path.
+REPORT_FORMAT_SUFFIXES = {'json': '.json', 'msgpack': '.msgpack'}
+
+# Report mirrors are copied file-to-file in the kernel where sendfile accepts a regular-file destination.
+_HAS_SENDFILE = sys.platform.startswith('linux') and hasattr(os, 'sendfile')
+
 # NOTE: Assuming ACVMProcessor exists and handles run_simulation, get_current_time methods.
-try:
-    # Using absolute import for high-level components
+# Processors may also provide run_simulation_iter(), yielding (constraint_id, success) pairs lazily, and/or
+# run_simulation_arrays(), returning (constraint_ids, outcomes) with outcomes a NumPy bool array.
+# It is imported on first use, so consumers of ArtifactLoader/load_cpr_config do not load the ACVM subsystem.
+if TYPE_CHECKING:
     from system.acvm.acvm_processor import ACVMProcessor
-except ImportError:
-    # Critical IH Precursor signal for missing dependency
-    logger.error("ACVMProcessor dependency not found or improperly path resolved. Exiting.")
-    sys.exit(1) # Exit signal 1: System component failure
+
+
+def _acvm_processor_class() -> type:
+    try:
+        # Using absolute import for high-level components
+        from system.acvm.acvm_processor import ACVMProcessor
+    except ImportError as e:
+        # Critical IH Precursor signal for missing dependency
+        logger.error("ACVMProcessor dependency not found or improperly path resolved.")
+        raise ACVMUnavailableError("ACVM component missing: system.acvm.acvm_processor could not be imported.") from e
+    return ACVMProcessor
 
 
 class ArtifactLoader:
     """Utility class to safely load structured artifacts and raise controlled exceptions."""
     @staticmethod
-    def load(path: str) -> Dict[str, Any]:
+    def load(path: str, keys: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Loads the JSON artifact at `path`. When `keys` is given, only those top-level keys are kept;
+        large artifacts are then streamed so only one top-level value is materialized at a time.
+        
+        Parsed documents are cached per (path, mtime, size) and shared between callers, so the
+        returned data must be treated as read-only.
+        """
         if not path:
             raise ArtifactLoadingError("Artifact path cannot be empty.", error_code=101)
         try:
-            with open(path, 'r') as f:
-                return json.load(f)
+            st = os.stat(path)
+            if keys is None:
+                return _parse_cached(path, st.st_mtime_ns, st.st_size)
+            
+            wanted = frozenset(keys)
+            if ijson is not None and st.st_size > STREAMING_THRESHOLD_BYTES:
+                # ijson pulls its own 64 KiB chunks, so a BufferedReader would only add a copy per chunk.
+                with open(path, 'rb', buffering=0) as f:
+                    return {k: v for k, v in ijson.kvitems(f, '', use_float=True) if k in wanted}
+            data = _parse_cached(path, st.st_mtime_ns, st.st_size)
+            if not isinstance(data, dict):
+                return data
+            return {k: v for k, v in data.items() if k in wanted}
         except FileNotFoundError:
             raise ArtifactLoadingError(
                 f"Required artifact not found: {path}. Check artifact cache state.", error_code=102
             )
-        except json.JSONDecodeError:
+        except _JSON_ERRORS:
             raise ArtifactLoadingError(
                 f"Invalid JSON structure in artifact: {path}. Data corruption detected.", error_code=103
             )
 
+    @staticmethod
+    def load_records(path: str, prefix: str) -> Iterable[Any]:
+        """
+        Returns the records of the array at ijson `prefix` (e.g. 'constraints.item') in the artifact at
+        `path`. Artifacts above RECORD_STREAMING_THRESHOLD_BYTES are returned as a single-pass generator
+        that parses one record at a time; smaller ones as a (shared, read-only) list from the parse cache.
+        """
+        if not path:
+            raise ArtifactLoadingError("Artifact path cannot be empty.", error_code=101)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            raise ArtifactLoadingError(
+                f"Required artifact not found: {path}. Check artifact cache state.", error_code=102
+            )
+        if ijson is not None and st.st_size > RECORD_STREAMING_THRESHOLD_BYTES:
+            return _iter_records(path, prefix)
+        
+        node = ArtifactLoader.load(path)
+        *keys, item = prefix.split('.')
+        for k in keys:
+            node = node.get(k) if isinstance(node, dict) else None
+        if item != 'item' or not isinstance(node, list):
+            raise ArtifactLoadingError(f"No record array at '{prefix}' in artifact: {path}.", error_code=104)
+        return node
+
+    @staticmethod
+    def _parse(path: str) -> Any:
+        # Unbuffered binary read: one fstat-sized read, no text decoding pass or isatty probe.
+        # Both parsers consume UTF-8 bytes directly.
+        with open(path, 'rb', buffering=0) as f:
+            raw = f.readall()
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+
+
+@lru_cache(maxsize=64)
+def _parse_cached(path: str, mtime_ns: int, size: int) -> Any:
+    # mtime_ns/size only key the cache: a rewritten artifact is parsed again. Errors are not cached.
+    return ArtifactLoader._parse(path)
+
+
+def _iter_records(path: str, prefix: str) -> Iterable[Any]:
+    # The file is opened on first iteration and closed when the generator is exhausted or discarded.
+    try:
+        with open(path, 'rb', buffering=0) as f:
+            yield from ijson.items(f, prefix, use_float=True)
+    except ijson.JSONError:
+        raise ArtifactLoadingError(
+            f"Invalid JSON structure in artifact: {path}. Data corruption detected.", error_code=103
+        )
+
+
+def serialize_report(report: SimulationReport, pretty: bool = False, report_format: str = 'json') -> bytes:
+    """
+    Serializes a CPR report to newline-terminated UTF-8 JSON (orjson when available): compact by
+    default, since reports are machine-consumed, or with a 2-space indent when `pretty` is set.
+    With orjson, NumPy arrays and scalars in detailed results are serialized natively.
+    
+    With report_format='msgpack' the report is packed as MessagePack instead (`pretty` is ignored).
+    """
+    if report_format == 'msgpack':
+        return msgpack.packb(report, use_bin_type=True)
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(report, option=option)
+    if pretty:
+        return (json.dumps(report, indent=2) + '\n').encode('utf-8')
+    return (json.dumps(report, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def _replace_via_temp(path: str, fill: Callable[[int], None]) -> None:
+    # fill() writes the content to a sibling temp file descriptor, which is then renamed over `path`,
+    # so a crash never leaves a truncated file behind.
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            fill(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_report(path: str, payload: bytes) -> None:
+    """
+    Writes the serialized report straight to a file descriptor, bypassing Python's buffered file layer.
+    The bytes go to a sibling temp file that is then renamed over `path`, so a crash never leaves a
+    truncated report. The report is not persistence-critical, so it is not fsync'ed.
+    """
+    def fill(fd: int) -> None:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+
+    _replace_via_temp(path, fill)
+
+
+def mirror_report(path: str, mirror_paths: Iterable[str]) -> Dict[str, OSError]:
+    """
+    Copies the report already written at `path` to each mirror path without re-serializing it.
+    On Linux the bytes are copied in-kernel with os.sendfile; elsewhere shutil.copyfileobj is used.
+    Mirrors are replaced atomically, like the primary report. A failing mirror does not stop the
+    others; returns the error for each mirror path that could not be written (empty on success).
+    """
+    with open(path, 'rb', buffering=0) as src:
+        src_fd = src.fileno()
+        size = os.fstat(src_fd).st_size
+
+        def fill(fd: int) -> None:
+            if not _HAS_SENDFILE:
+                src.seek(0)
+                with open(fd, 'wb', closefd=False) as dst:
+                    shutil.copyfileobj(src, dst)
+                return
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(fd, src_fd, offset, size - offset)
+                if not sent:
+                    break
+                offset += sent
+
+        failures: Dict[str, OSError] = {}
+        for mirror_path in mirror_paths:
+            try:
+                _replace_via_temp(mirror_path, fill)
+            except OSError as e:
+                failures[mirror_path] = e
+        return failures
+
+
+@lru_cache(maxsize=8)
+def _build_processor(acvm_config_path: str, mtime_ns: int, size: int) -> 'ACVMProcessor':
+    # mtime_ns/size only key the cache: an edited config file yields a new entry (and a fresh processor).
+    return _acvm_processor_class()(ArtifactLoader.load(acvm_config_path))
+
+
+def get_acvm_processor(acvm_config_path: str) -> 'ACVMProcessor':
+    """
+    Returns an ACVMProcessor for the config file at acvm_config_path, shared across simulators for as
+    long as the file is unchanged, so repeated gate runs skip config parsing and processor warmup.
+    """
+    if not acvm_config_path:
+        raise ArtifactLoadingError("Artifact path cannot be empty.", error_code=101)
+    try:
+        st = os.stat(acvm_config_path)
+    except FileNotFoundError:
+        raise ArtifactLoadingError(
+            f"Required artifact not found: {acvm_config_path}. Check artifact cache state.", error_code=102
+        )
+    return _build_processor(acvm_config_path, st.st_mtime_ns, st.st_size)
+
 
 class CPRSimulator:
     """
@@ -69,80 +306,206 @@ class CPRSimulator:
     Refinement: Decoupled configuration via constructor injection.
     """
 
-    def __init__(self, cpr_config: Dict[str, Any], acvm_config: ACVMConfig):
-        """Initializes the simulator with core ACVM configuration and CPR tool settings."""
+    def __init__(self, cpr_config: Dict[str, Any], acvm_config: Optional[ACVMConfig] = None):
+        """
+        Initializes the simulator with core ACVM configuration and CPR tool settings.
+        Without an explicit acvm_config, the processor for cpr_config['acvm_config_path'] is reused
+        from the shared cache (see get_acvm_processor).
+        """
         self.config = cpr_config
         # Use config paths/keys, falling back to robust defaults if config manager fails.
         self.report_path_default: str = self.config.get('report_output_path', 'output/s09_cpr_metrics.json')
-        self.required_artifact_keys: List[str] = self.config.get('required_artifacts', ['GAX_I', 'GAX_II', 'GAX_III'])
+        self.required_artifact_keys: Tuple[str, ...] = tuple(self.config.get('required_artifacts', ('GAX_I', 'GAX_II', 'GAX_III')))
+        # Optional projection: artifact key -> top-level fields the ACVM processor consumes. Artifacts
+        # without an entry are loaded in full.
+        self.artifact_fields: Dict[str, List[str]] = self.config.get('artifact_fields', {})
+        # Reports are written compact unless a human-readable layout is requested.
+        self.pretty_report: bool = bool(self.config.get('pretty_report', False))
+        # 'json' (default) or 'msgpack' for machine-only consumers; the default report path's extension follows it.
+        self.report_format: str = self.config.get('report_format', 'json')
+        if self.report_format not in REPORT_FORMAT_SUFFIXES:
+            raise CPRToolError(f"Unsupported report_format '{self.report_format}'. Expected one of {list(REPORT_FORMAT_SUFFIXES)}.")
+        if self.report_format == 'msgpack' and msgpack is None:
+            raise CPRToolError("report_format 'msgpack' requires the msgpack package.")
+        stem, ext = os.path.splitext(self.report_path_default)
+        if ext in REPORT_FORMAT_SUFFIXES.values():
+            self.report_path_default = stem + REPORT_FORMAT_SUFFIXES[self.report_format]
+        # Optional fail-fast shape checks: artifact key -> JSON Schema, applied to the (projected) artifact
+        # before the ACVM processor runs.
+        self._artifact_validators: Dict[str, Callable[[Any], Any]] = self._compile_artifact_schemas(
+            self.config.get('artifact_schemas', {})
+        )
+        # Optional record streaming: artifact key -> ijson prefix of its record array (e.g. 'constraints.item').
+        # The processor then receives an iterable of records for that key instead of the document; large
+        # artifacts are parsed lazily as it iterates. Projections and schema checks do not apply to them.
+        self.streamed_artifacts: Dict[str, str] = self.config.get('streamed_artifacts', {})
+        # Extra destinations (e.g. a CI artifact store mount) receiving a byte copy of each report.
+        self.report_mirror_paths: Tuple[str, ...] = tuple(self.config.get('report_mirror_paths', ()))
         
-        logger.info(f"[CPR_INIT] Initializing ACVM Processor with provided configuration.")
-        self.processor = ACVMProcessor(acvm_config)
+        if acvm_config is None:
+            acvm_config_path = self.config.get('acvm_config_path')
+            logger.info("[CPR_INIT] Using ACVM Processor for configuration %s.", acvm_config_path)
+            self.processor = get_acvm_processor(acvm_config_path)
+        else:
+            logger.info("[CPR_INIT] Initializing ACVM Processor with provided configuration.")
+            self.processor = _acvm_processor_class()(acvm_config)
+
+    @staticmethod
+    def _compile_artifact_schemas(schemas: Dict[str, Dict[str, Any]]) -> Dict[str, Callable[[Any], Any]]:
+        if not schemas:
+            return {}
+        if fastjsonschema is None:
+            logger.warning("[CPR_INIT] fastjsonschema not installed; artifact schema pre-checks are disabled.")
+            return {}
+        validators = {}
+        for key, schema in schemas.items():
+            try:
+                # use_default=False: validators must not write defaults into the shared, cached artifacts.
+                validators[key] = fastjsonschema.compile(schema, use_formats=False, use_default=False)
+            except fastjsonschema.JsonSchemaDefinitionException as e:
+                raise CPRToolError(f"Invalid artifact schema for {key}: {e}")
+        return validators
+
+    def _check_artifact(self, key: str, path: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Checks the artifact loaded for `key` against its configured schema, if any."""
+        validate = self._artifact_validators.get(key)
+        if validate is not None:
+            try:
+                validate(data)
+            except fastjsonschema.JsonSchemaValueException as e:
+                raise ArtifactLoadingError(
+                    f"Artifact {path} does not match the expected schema: {e.message}", error_code=105
+                )
+        return data
 
-    def run_pre_resolution(self, artifact_path_map: Dict[str, str], output_path: Optional[str] = None) -> SimulationReport:
+    def run_pre_resolution(self, artifact_path_map: Dict[str, str], output_path: Optional[str] = None, fast_fail: bool = False) -> SimulationReport:
         """
         Executes the S09 simulation run, verifying constraints against staged GAX data.
 
         Args:
             artifact_path_map: Dictionary mapping internal GAX identifiers to file paths.
             output_path: Optional path to save the metrics report.
+            fast_fail: Stop evaluating constraints at the first failure. Requires a processor with
+                run_simulation_iter(); detailed_results then only covers the constraints evaluated.
         """
         
         # 1. Load and Verify Artifacts
         staged_artifacts: ArtifactMap = {}
-        logger.info(f"[CPR_LOAD] Validating {len(self.required_artifact_keys)} artifact keys...")
+        logger.info("[CPR_LOAD] Validating %d artifact keys...", len(self.required_artifact_keys))
         
-        for key in self.required_artifact_keys:
-            path = artifact_path_map.get(key)
-            if not path:
-                raise CPRToolError(
-                    f"Missing required artifact path configuration for {key}. Keys required: {self.required_artifact_keys}"
-                )
-            
-            # Loading logic centralized in ArtifactLoader
-            try:
-                staged_artifacts[key] = ArtifactLoader.load(path)
-                logger.debug(f"[CPR_LOAD] Successfully loaded {key} artifact from {path}")
-            except ArtifactLoadingError as e:
-                # Re-raise with context to halt execution
-                raise CPRToolError(f"Failed to load artifact {key}: {e}")
+        # Resolve every path before any file is opened, so a bad mapping fails without partial loads.
+        keyed_paths = [(key, artifact_path_map.get(key)) for key in self.required_artifact_keys]
+        missing_keys = [key for key, path in keyed_paths if not path]
+        if missing_keys:
+            raise CPRToolError(
+                f"Missing required artifact path configuration for {missing_keys}. Keys required: {list(self.required_artifact_keys)}"
+            )
+        
+        # Loading logic centralized in ArtifactLoader; all artifacts are read concurrently, and
+        # results are collected in key order so the first failing key is the one reported.
+        # Keys resolving to the same file (and projection) share one load and one parsed document.
+        workers = max(1, min(MAX_ARTIFACT_LOAD_WORKERS, len(keyed_paths)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            loads: Dict[Tuple[str, Optional[FrozenSet[str]]], Future] = {}
+            pending = []
+            for key, path in keyed_paths:
+                prefix = self.streamed_artifacts.get(key)
+                if prefix is not None:
+                    # Never shared: a streamed generator can only be consumed once.
+                    pending.append((key, path, executor.submit(ArtifactLoader.load_records, path, prefix)))
+                    continue
+                fields = self.artifact_fields.get(key)
+                load_key = (os.path.realpath(path), None if fields is None else frozenset(fields))
+                future = loads.get(load_key)
+                if future is None:
+                    future = loads[load_key] = executor.submit(ArtifactLoader.load, path, fields)
+                pending.append((key, path, future))
+            for key, path, future in pending:
+                try:
+                    data = future.result()
+                    staged_artifacts[key] = data if key in self.streamed_artifacts else self._check_artifact(key, path, data)
+                    logger.debug("[CPR_LOAD] Successfully loaded %s artifact from %s", key, path)
+                except ArtifactLoadingError as e:
+                    # Re-raise with context to halt execution
+                    raise CPRToolError(f"Failed to load artifact {key}: {e}")
 
         # 2. Run Simulation
         logger.info("[CPR_SIM] Initiating constraint evaluation using ACVM Processor...")
-        start_time = time.time()
+        # Elapsed time uses the high-resolution monotonic performance counter, so wall-clock
+        # adjustments cannot skew it; the wall clock is read only for the report timestamp.
+        start_ns = time.perf_counter_ns()
         
         # The ACVM processor handles the core logic of comparing the artifacts against internal constraints
-        results: SimulationResults = self.processor.run_simulation(staged_artifacts)
+        results: SimulationResults
+        overall_success: Optional[bool] = None
+        short_circuited = False
+        run_simulation_arrays = getattr(self.processor, 'run_simulation_arrays', None)
+        run_simulation_iter = getattr(self.processor, 'run_simulation_iter', None)
+        if fast_fail and run_simulation_iter is not None:
+            results = {}
+            for constraint_id, success in run_simulation_iter(staged_artifacts):
+                results[constraint_id] = success
+                if not success:
+                    # Overall failure is decided; skip the remaining constraint evaluations.
+                    short_circuited = True
+                    break
+        elif run_simulation_arrays is not None:
+            constraint_ids, outcomes = run_simulation_arrays(staged_artifacts)
+            # Reduce over the contiguous bool array in C; the dict is only kept for the detailed report.
+            overall_success = bool(outcomes.all())
+            results = dict(zip(constraint_ids, outcomes.tolist()))
+        else:
+            results = self.processor.run_simulation(staged_artifacts)
         
-        duration = time.time() - start_time
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
 
         # 3. Generate Report
-        overall_success = all(results.values())
+        # One pass collects the failing constraints for triage; the array path skips it when all passed.
+        failed_ids: List[str] = [] if overall_success else [cid for cid, ok in results.items() if not ok]
+        overall_success = not failed_ids
         report: SimulationReport = {
             'stage': 'S09_CPR_PRE_COMMIT',
-            'timestamp': int(time.time()), 
+            'timestamp': time.time_ns() // 1_000_000_000, 
             'execution_duration_sec': round(duration, 4),
             'overall_success': overall_success,
             'detailed_results': results,
-            'source_artifact_paths': artifact_path_map
+            'failed_constraint_ids': failed_ids,
+            'short_circuited': short_circuited,
+            # Shallow copy: the report must not alias a mapping the caller may keep mutating.
+            'source_artifact_paths': dict(artifact_path_map)
         }
         
         # 4. Critical Signaling Check
         if not overall_success:
-            logger.warning("[CPR ALERT S09] Pre-Commit Constraint Failure Detected. Signaling RRP (Required Rework Protocol) initiation.")
+            logger.warning(
+                "[CPR ALERT S09] Pre-Commit failure in %d constraints: %s. Signaling RRP (Required Rework Protocol) initiation.",
+                len(failed_ids), failed_ids[:10]
+            )
         else:
             logger.info("[CPR SUCCESS] All S09 constraints validated successfully.")
         
         # 5. Save Report
         final_output_path = output_path or self.report_path_default
         try:
-            with open(final_output_path, 'w') as f:
-                json.dump(report, f, indent=4)
-            logger.info(f"[CPR SAVE] Metrics report saved to {final_output_path}")
+            write_report(final_output_path, serialize_report(report, pretty=self.pretty_report, report_format=self.report_format))
+            logger.info("[CPR SAVE] Metrics report saved to %s", final_output_path)
         except IOError as e:
             # Raise instead of print/sys.exit, allowing calling context to handle failure
             raise CPRToolError(f"Could not save report to {final_output_path}: {e}")
 
+        # Mirrors are copied from the saved primary; their failures are reported per mirror path.
+        if self.report_mirror_paths:
+            try:
+                failures = mirror_report(final_output_path, self.report_mirror_paths)
+            except IOError as e:
+                raise CPRToolError(f"Report saved to {final_output_path}, but it could not be read back for mirroring: {e}")
+            mirrored = [p for p in self.report_mirror_paths if p not in failures]
+            if mirrored:
+                logger.info("[CPR SAVE] Metrics report mirrored to %s", mirrored)
+            if failures:
+                details = "; ".join(f"{p}: {err}" for p, err in failures.items())
+                raise CPRToolError(f"Report saved to {final_output_path}, but mirroring failed for {details}")
+
         return report
 
 def load_cpr_config() -> Dict[str, Any]:
@@ -151,11 +514,11 @@ def load_cpr_config() -> Dict[str, Any]:
     
     try:
         config = ArtifactLoader.load(CPR_CONFIG_PATH)
-        logger.info(f"Configuration loaded from {CPR_CONFIG_PATH}")
+        logger.info("Configuration loaded from %s", CPR_CONFIG_PATH)
         return config
     except CPRToolError:
         # Fallback to hardcoded internal defaults if configuration file is missing/corrupt.
-        logger.warning(f"CPR Config file not found or load failed. Using built-in defaults.")
+        logger.warning("CPR Config file not found or load failed. Using built-in defaults.")
         return {
             'report_output_path': 'output/s09_cpr_metrics.json',
             'required_artifacts': ['GAX_I', 'GAX_II', 'GAX_III'],
@@ -168,9 +531,6 @@ def main():
     try:
         # 1. Load Configurations
         CPR_TOOL_CONFIG = load_cpr_config()
-        
-        ACVM_PATH = CPR_TOOL_CONFIG.get('acvm_config_path') # Retrieved from config or default
-        acvm_config = ArtifactLoader.load(ACVM_PATH)
 
         # Artifact Path Definition (These typically vary per stage/run and might not belong in static config)
         PATHS_MAPPING = {
@@ -179,8 +539,8 @@ def main():
             'GAX_III': 'artifact_cache/csr_s01.json'
         }
 
-        # 2. Initialize and Run
-        simulator = CPRSimulator(cpr_config=CPR_TOOL_CONFIG, acvm_config=acvm_config)
+        # 2. Initialize and Run (ACVM config is read from CPR_TOOL_CONFIG['acvm_config_path'])
+        simulator = CPRSimulator(cpr_config=CPR_TOOL_CONFIG)
         report = simulator.run_pre_resolution(artifact_path_map=PATHS_MAPPING)
 
         # 3. Handle Exit Signaling
@@ -190,13 +550,16 @@ def main():
         else:
             logger.info("[MAIN] Simulation successful. S09 pre-commit validated.")
 
+    except ACVMUnavailableError as e:
+        logger.critical("[MAIN CRITICAL FAILURE] %s", e, exc_info=False)
+        sys.exit(1) # Exit signal 1: System component failure
     except CPRToolError as e:
         # Handles specific operational or artifact loading errors
-        logger.critical(f"[MAIN CRITICAL FAILURE] Execution failed during S09 resolution: {e}", exc_info=False)
+        logger.critical("[MAIN CRITICAL FAILURE] Execution failed during S09 resolution: %s", e, exc_info=False)
         sys.exit(11) # Signal 11: Controlled runtime exception
     except Exception as e:
         # Catch unexpected Python errors
-        logger.critical(f"[MAIN UNEXPECTED FAILURE] An unhandled system error occurred: {e}", exc_info=True)
+        logger.critical("[MAIN UNEXPECTED FAILURE] An unhandled system error occurred: %s", e, exc_info=True)
         sys.exit(99) # Signal 99: Unexpected system error
 
 
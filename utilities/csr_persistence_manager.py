@@ -4,9 +4,15 @@
 
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logging.basicConfig(level=logging.INFO, format='%(levelname)s:CSR_PERSISTENCE:%(message)s')
 
 class CSRPersistenceManager:
@@ -14,11 +20,23 @@ class CSRPersistenceManager:
     
     ENCODING = 'utf-8'
 
-    def __init__(self, storage_path: str = 'runtime/state/csr_root.json'):
+    def __init__(self, storage_path: str = 'runtime/state/csr_root.json', pretty: bool = False):
         self._storage_path = Path(storage_path)
+        # Plain str form for the I/O calls, so each one skips PurePath.__fspath__.
+        self._storage_path_str: str = os.fspath(self._storage_path)
+        # State is written compact unless a human-readable (indented) file is requested.
+        self._pretty = pretty
         # Ensure the directory exists before attempting writes
         self._storage_path.parent.mkdir(parents=True, exist_ok=True)
 
+    def _serialize(self, state: Dict[str, Any]) -> bytes:
+        """Serializes the state document to UTF-8 JSON (orjson when available), indented only if pretty."""
+        if orjson is not None:
+            return orjson.dumps(state, option=orjson.OPT_INDENT_2 if self._pretty else None)
+        if self._pretty:
+            return json.dumps(state, indent=2).encode(self.ENCODING)
+        return json.dumps(state, separators=(',', ':')).encode(self.ENCODING)
+
     def store_csr(self, csr_hash: str, metadata: Dict[str, Any]) -> None:
         """Stores the CSR hash and associated generation metadata atomically."""
         if not csr_hash:
@@ -29,28 +47,38 @@ class CSRPersistenceManager:
             "metadata": metadata
         }
 
+        # Atomic write: the state is written and fsync'ed to a sibling temp file, then renamed over the
+        # target, so readers never observe a partially written CSR even if the process dies mid-write.
+        tmp_path = f"{self._storage_path_str}.tmp.{os.getpid()}"
         try:
-            # Atomic write (Write to temp, then rename) is safer but using direct write for brevity/initial scaffold.
-            with open(self._storage_path, 'w', encoding=self.ENCODING) as f:
-                json.dump(state, f, indent=4)
-            logging.info(f"CSR successfully stored at {self._storage_path}")
+            with open(tmp_path, 'wb') as f:
+                f.write(self._serialize(state))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._storage_path_str)
+            logging.info("CSR successfully stored at %s", self._storage_path_str)
         except IOError as e:
-            logging.error(f"Failed to write CSR state file: {e}")
+            logging.error("Failed to write CSR state file: %s", e)
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
             raise
 
     def load_csr(self) -> Optional[str]:
         """Loads the stored CSR hash, if available."""
-        if not self._storage_path.exists():
-            logging.warning(f"CSR state file not found at {self._storage_path}")
-            return None
-
         try:
-            with open(self._storage_path, 'r', encoding=self.ENCODING) as f:
-                data = json.load(f)
-                if 'csr_hash' in data:
-                    return data['csr_hash']
-                logging.error("CSR state file corrupted: missing 'csr_hash' field.")
-                return None
-        except (IOError, json.JSONDecodeError) as e:
-            logging.error(f"Error reading/decoding CSR state file: {e}")
+            with open(self._storage_path_str, 'rb', buffering=0) as f:
+                raw = f.readall()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            if 'csr_hash' in data:
+                return data['csr_hash']
+            logging.error("CSR state file corrupted: missing 'csr_hash' field.")
+            return None
+        except FileNotFoundError:
+            # Opened directly rather than probed with exists(): one stat fewer on the common path.
+            logging.warning("CSR state file not found at %s", self._storage_path_str)
+            return None
+        except (IOError, json.JSONDecodeError) as e:  # orjson.JSONDecodeError subclasses it
+            logging.error("Error reading/decoding CSR state file: %s", e)
             return None
@@ -2,8 +2,11 @@
 # Mandate: Process signed Forensic Data & Log Snapshots (FDLS) to ensure continuous operational feedback and failure analysis integrity.
 
 import json
+import os
+import threading
+import weakref
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
 # --- System Dependencies (Mocked/Injected) ---
 # NOTE: Assumes AGI_AuditSystem handles persistence, integrity, and structured logging.
@@ -16,50 +19,213 @@ class AGI_AuditLog:
     def audit(msg): return print(f"[AGI_LOG: AUDIT] {msg}")
 
 # --- Configuration ---
-DEFAULT_REGISTRY_PATH = Path('config/failure_registry.json')
+# Append-only JSONL: one compact incident record per line, so each ingest writes O(1) bytes.
+DEFAULT_REGISTRY_PATH = Path('config/failure_registry.jsonl')
+# Registries written before V94.3 were one JSON document ({"version": ..., "reports": [...]}) at the same
+# path with a .json suffix; they are imported into the JSONL trail the first time it is opened.
+LEGACY_REGISTRY_SUFFIX = '.json'
+REGISTRY_VERSION = "V94.2"
 MINIMUM_REQUIRED_FIELDS = ["ih_time", "p_set_id", "gsep_stage", "summary"]
+# Group commit: buffered incidents are written with one write()+fsync() once this many are pending,
+# or at the latest this many seconds after the first one was buffered. A max size of 1 writes through.
+AUDIT_TRAIL_BUFFER_MAX_SIZE = 500
+AUDIT_TRAIL_BUFFER_FLUSH_INTERVAL = 30.0
+# While registry writes keep failing, at most this many incidents are held for retry; further ingests
+# are rejected (and reported as such) instead of growing memory without bound.
+AUDIT_TRAIL_BACKLOG_LIMIT = 10 * AUDIT_TRAIL_BUFFER_MAX_SIZE
+
+
+def _write_pending(registry_path: Path, pending: List[str]) -> None:
+    """Appends the pending JSONL lines with one write() and one fsync(), then clears them. Raises OSError."""
+    with open(registry_path, 'a', encoding='utf-8') as f:
+        f.write(''.join(pending))
+        f.flush()
+        os.fsync(f.fileno())
+    pending.clear()
+
+
+def _flush_on_finalize(registry_path: Path, pending: List[str], lock: threading.Lock) -> None:
+    # weakref.finalize callback, run when an EPRU is garbage-collected or at interpreter exit. It must
+    # not reference the EPRU itself, or the instance could never be collected.
+    with lock:
+        if not pending:
+            return
+        try:
+            _write_pending(registry_path, pending)
+        except OSError as e:
+            print(f"[AGI_LOG: ERROR] EPRU shutdown flush failed; {len(pending)} incidents not written to {registry_path}: {e}")
 
 class EPRU:
-    def __init__(self, registry_path: Path = DEFAULT_REGISTRY_PATH, audit_log=AGI_AuditLog):
+    def __init__(self, registry_path: Path = DEFAULT_REGISTRY_PATH, audit_log=AGI_AuditLog,
+                 buffer_max_size: int = AUDIT_TRAIL_BUFFER_MAX_SIZE,
+                 flush_interval: float = AUDIT_TRAIL_BUFFER_FLUSH_INTERVAL,
+                 backlog_limit: int = AUDIT_TRAIL_BACKLOG_LIMIT):
         self.log = audit_log
         self.registry_path = registry_path
-        self.registry: Dict[str, Any] = {"version": "V94.2", "reports": []}
-        self._load_registry()
-
-    def _load_registry(self) -> None:
-        """Loads the failure registry, creating it if it doesn't exist or handling corruption."""
+        self.buffer_max_size = max(1, buffer_max_size)
+        self.flush_interval = flush_interval
+        self.backlog_limit = max(self.buffer_max_size, backlog_limit)
+        self._pending: List[str] = []
+        self._lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        # Pending incidents are written out when the instance is collected or the interpreter exits;
+        # the finalizer holds only the buffer and lock, not the instance.
+        self._finalizer = weakref.finalize(self, _flush_on_finalize, self.registry_path, self._pending, self._lock)
+        self._import_legacy_registry()
         if not self.registry_path.exists():
             self.log.info(f"Registry not found. Initializing new registry at {self.registry_path}.")
+        self.registry_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _import_legacy_registry(self) -> None:
+        """Converts a single-document legacy registry into the JSONL trail.
+
+        Runs only while the JSONL registry does not exist yet (or when registry_path is itself a legacy
+        document). A legacy file that cannot be read raises RuntimeError rather than letting the
+        service start an empty audit trail alongside it.
+        """
+        legacy_path = self.registry_path.with_suffix(LEGACY_REGISTRY_SUFFIX)
+        if not legacy_path.exists():
+            return
+        if legacy_path != self.registry_path and self.registry_path.exists():
             return
 
         try:
-            with open(self.registry_path, 'r') as f:
+            with open(legacy_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
+        except json.JSONDecodeError as e:
+            if legacy_path == self.registry_path:
+                # Not a single JSON document, i.e. already a JSONL trail.
+                return
+            raise RuntimeError(f"Legacy EPRU registry {legacy_path} is corrupted and cannot be imported: {e}") from e
+        except OSError as e:
+            raise RuntimeError(f"Legacy EPRU registry {legacy_path} could not be read: {e}") from e
+
+        reports = data.get("reports") if isinstance(data, dict) else None
+        if not isinstance(reports, list):
+            if legacy_path == self.registry_path:
+                # A one-record JSONL trail also parses as a single JSON document.
+                return
+            raise RuntimeError(f"Legacy EPRU registry {legacy_path} is invalid (reports key missing or not a list).")
 
-            if not isinstance(data.get("reports"), list):
-                # Critical structural failure, but file is readable JSON.
-                raise ValueError("Registry structure invalid (reports key missing or not a list).")
-
-            self.registry.update(data)
-                
-        except json.JSONDecodeError:
-            self.log.error(f"FATAL CORRUPTION: Registry file {self.registry_path} is corrupted. Resetting reports structure.")
-            self.registry["reports"] = []
-        except Exception as e:
-            self.log.error(f"Unexpected error loading registry: {type(e).__name__}: {e}. Initializing clean reports list.")
-            self.registry["reports"] = []
-
-    def _save_registry(self) -> None:
-        """Writes the updated registry state. WARNING: This overwrites the entire file. Must migrate to JSONL/DB for high volume audit logs."""
+        tmp_path = self.registry_path.with_name(f"{self.registry_path.name}.tmp.{os.getpid()}")
         try:
-            self.registry_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Note: For true audit integrity, an atomic write strategy (temp file then rename) is usually preferred over direct overwrite.
-            with open(self.registry_path, 'w') as f:
-                json.dump(self.registry, f, indent=4, ensure_ascii=False)
-            
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.writelines(json.dumps(r, separators=(',', ':'), ensure_ascii=False) + '\n' for r in reports)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.registry_path)
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            raise RuntimeError(f"Failed to import legacy EPRU registry {legacy_path}: {e}") from e
+        self.log.info(f"Imported {len(reports)} incidents from legacy registry {legacy_path} into {self.registry_path}.")
+
+    @property
+    def reports(self) -> List[Dict[str, Any]]:
+        """Snapshot of all logged incidents, oldest first. Changing it does not alter the registry."""
+        return list(self.iter_reports())
+
+    @property
+    def registry(self) -> Dict[str, Any]:
+        """Snapshot in the legacy single-document shape ({"version", "reports"}), read via iter_reports()."""
+        return {"version": REGISTRY_VERSION, "reports": self.reports}
+
+    def iter_reports(self) -> Iterator[Dict[str, Any]]:
+        """Lazily yields the logged incidents, oldest first. Only audit-read paths need the history."""
+        self.flush()
+        for _, record in self._read_records():
+            yield record
+
+    def _read_records(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yields (raw line, parsed record) for every readable registry line."""
+        try:
+            with open(self.registry_path, 'r', encoding='utf-8') as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield line, json.loads(line)
+                    except json.JSONDecodeError:
+                        # Corruption is confined to one record; the rest of the trail stays readable.
+                        self.log.error(f"CORRUPTION: Registry {self.registry_path} line {line_no} is not valid JSON. Record skipped.")
+        except FileNotFoundError:
+            return
+
+    def compact(self) -> int:
+        """
+        Rewrites the registry without blank or corrupt lines and returns the number of records kept.
+        The new file is written and fsync'ed next to the registry, then atomically renamed over it, so a
+        crash during compaction leaves either the old or the new registry, never a truncated one.
+        """
+        tmp_path = self.registry_path.with_name(f"{self.registry_path.name}.tmp.{os.getpid()}")
+        with self._lock:
+            # Holding the lock keeps appends (and the flush timer) out until the rename is done.
+            self._flush_locked()
+            kept = 0
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    for line, _ in self._read_records():
+                        f.write(line if line.endswith('\n') else line + '\n')
+                        kept += 1
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.registry_path)
+            except IOError as e:
+                self.log.error(f"I/O Error: Failed to compact EPRU registry: {e}")
+                try:
+                    tmp_path.unlink()
+                except FileNotFoundError:
+                    pass
+                raise
+        return kept
+
+    def _append_incident(self, entry: Dict[str, Any]) -> Optional[bool]:
+        """
+        Buffers one incident record for the registry. The buffer is written as a single append and fsync
+        (write-ahead-log style group commit) when it is full, when the flush interval elapses, on flush(),
+        and when the EPRU is closed, collected, or the interpreter exits.
+
+        Returns True if the record is durably written, False if it is buffered awaiting a flush, and
+        None if it was rejected because failed writes have filled the backlog.
+        """
+        line = json.dumps(entry, separators=(',', ':'), ensure_ascii=False) + '\n'
+        with self._lock:
+            if len(self._pending) >= self.backlog_limit and not self._flush_locked():
+                self.log.error(
+                    f"EPRU backlog full: {len(self._pending)} incidents await a registry write that keeps failing. Incident rejected."
+                )
+                return None
+            self._pending.append(line)
+            if len(self._pending) >= self.buffer_max_size:
+                return self._flush_locked()
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+            return False
+
+    def flush(self) -> bool:
+        """Writes all buffered incidents to the registry and fsyncs it. Returns False if the write failed."""
+        with self._lock:
+            return self._flush_locked()
+
+    def close(self) -> None:
+        """Flushes buffered incidents and, once nothing is pending, releases the exit-time flush hook."""
+        if self.flush():
+            self._finalizer.detach()
+
+    def _flush_locked(self) -> bool:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending:
+            return True
+        try:
+            _write_pending(self.registry_path, self._pending)
+            return True
         except IOError as e:
-            self.log.error(f"I/O Error: Failed to save EPRU registry to disk: {e}")
+            # Records stay buffered (up to backlog_limit) and are retried on the next flush.
+            self.log.error(f"I/O Error: Failed to save EPRU registry to disk ({len(self._pending)} incidents pending): {e}")
+            return False
 
     def ingest_signed_fdls(self, signed_fdls: Dict[str, Any], aass_signature_valid: bool) -> bool:
         """Ingests a cryptographically signed FDLS, verifies signature status, and logs the incident."""
@@ -89,8 +255,11 @@ class EPRU:
             return False
 
         # 3. Log and Persist
-        self.registry["reports"].append(incident_data)
-        self._save_registry()
+        written = self._append_incident(incident_data)
+        if written is None:
+            return False
         
-        self.log.audit(f"Incident {incident_data['ih_trigger']} logged and sealed. GSEP Stage: {incident_data['gsep_stage']}.")
+        # Only claim durability once the record has actually been fsync'ed to the registry.
+        status = "logged and sealed" if written else "accepted; pending registry flush"
+        self.log.audit(f"Incident {incident_data['ih_trigger']} {status}. GSEP Stage: {incident_data['gsep_stage']}.")
         return True
\ No newline at end of file
